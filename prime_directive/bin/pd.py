@@ -1,31 +1,31 @@
 import asyncio
 import difflib
+import hashlib
 import json
 import logging
 import os
 import shutil
 import sys
 from click.core import ParameterSource
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Optional, cast
 
-import httpx
 import typer
 import yaml
 from dotenv import load_dotenv
 
 # Hydra imports
-from hydra import compose, initialize_config_dir
-from hydra.core.global_hydra import GlobalHydra
 from omegaconf import DictConfig, OmegaConf
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 
 # Core imports
-from prime_directive.core.config import register_configs
+from prime_directive.core.ai_providers import dispose_http_client
 from prime_directive.core.db import (
     ContextSnapshot,
     EventLog,
@@ -34,12 +34,9 @@ from prime_directive.core.db import (
     get_session,
     init_db,
 )
-from prime_directive.core.dependencies import (
-    get_ollama_status,
-    has_openai_api_key,
-)
 from prime_directive.core.dossier_ai import generate_theme_suggestions_with_ai
 from prime_directive.core.empire import load_empire_if_exists
+from prime_directive.core.event_loop import event_runner, run_async
 from prime_directive.core.git_utils import GitStatus, get_status
 from prime_directive.core.identity import (
     apply_operator_dossier_tag_normalization_fixes,
@@ -81,11 +78,37 @@ logger = logging.getLogger("prime_directive")
 
 _EXIT_CODE_SHELL_ATTACH = 88
 
+# Upper bound on git subprocess batches `status` runs at once
+_MAX_CONCURRENT_GIT_STATUS = 16
+
+# (minimum percent used, message) checked in order by `ai-usage`
+_BUDGET_STATUS_BANDS = (
+    (90.0, "  [bold red]⚠️  {pct:.1f}% of budget used![/bold red]"),
+    (75.0, "  [bold yellow]⚠️  {pct:.1f}% of budget used[/bold yellow]"),
+    (float("-inf"), "  [green]✅ {pct:.1f}% of budget used[/green]"),
+)
+
 app.add_typer(dossier_app, name="dossier")
 empire_app = typer.Typer()
 app.add_typer(empire_app, name="empire")
 
 
+def _format_minutes(timestamp: datetime) -> str:
+    """
+    Format a timestamp as "YYYY-MM-DD HH:MM".
+
+    Uses `isoformat`, which avoids re-parsing a `strftime` format string for
+    every row rendered. Any UTC offset suffix is dropped.
+
+    Parameters:
+        timestamp (datetime): The timestamp to format.
+
+    Returns:
+        str: The timestamp truncated to minute precision.
+    """
+    return timestamp.isoformat(sep=" ", timespec="minutes")[:16]
+
+
 def _normalize_repo_id(repo_id: str) -> str:
     """
     Normalize a repository identifier by trimming surrounding whitespace and removing any trailing forward or backward slashes.
@@ -118,54 +141,203 @@ def _resolve_repo_id(repo_id: str, cfg: DictConfig) -> str:
     raise typer.Exit(code=1)
 
 
+# Composed configs keyed by the source files' paths and mtimes
+_CONFIG_CACHE: dict[tuple[Any, ...], DictConfig] = {}
+# id(cfg) -> (cfg, its repos sorted by descending priority)
+_SORTED_REPOS_CACHE: dict[int, tuple[DictConfig, list[Any]]] = {}
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """
+    Return the modification time of `path` in nanoseconds, or None if it cannot be stat'ed.
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _config_disk_cache_dir() -> Path:
+    """
+    Return the directory holding the on-disk cache of composed configs.
+    """
+    return Path.home() / ".prime-directive" / "cache"
+
+
+def _config_disk_cache_file(cache_key: tuple[Any, ...]) -> Path:
+    """
+    Return the on-disk cache file for a composed config with the given cache key.
+
+    Parameters:
+        cache_key (tuple[Any, ...]): The key `load_config` uses for its in-memory cache (source paths and mtimes).
+
+    Returns:
+        Path: A file in `_config_disk_cache_dir()` whose name is a digest of `cache_key`.
+    """
+    digest = hashlib.blake2b(
+        repr(cache_key).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return _config_disk_cache_dir() / f"config-{digest}.yaml"
+
+
+def _write_config_disk_cache(path: Path, cfg: DictConfig) -> None:
+    """
+    Persist a composed config to `path`, replacing cache files for older keys.
+
+    The file is written atomically; failures are ignored because the cache is only an optimization.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        OmegaConf.save(cfg, tmp_path)
+        os.replace(tmp_path, path)
+        for stale in path.parent.glob("config-*.yaml"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {path}: {e}")
+
+
+def _expand_config_paths(cfg: DictConfig) -> None:
+    """
+    Resolve environment variables and `~` in the configured paths, in place.
+
+    Applies `os.path.expandvars` and `os.path.expanduser` to `cfg.system.db_path`, `cfg.system.log_path` and every `repo.path`, which also resolves interpolations such as `${oc.env:HOME}` against the current environment. Configs missing these keys are left unchanged.
+
+    Parameters:
+        cfg (DictConfig): Composed configuration, as built by Hydra or read back from the on-disk cache.
+    """
+    try:
+        cfg.system.db_path = os.path.expanduser(
+            os.path.expandvars(str(cfg.system.db_path))
+        )
+        cfg.system.log_path = os.path.expanduser(
+            os.path.expandvars(str(cfg.system.log_path))
+        )
+    except Exception:
+        pass
+
+    try:
+        for _rid, repo in cfg.repos.items():
+            repo.path = os.path.expanduser(os.path.expandvars(str(repo.path)))
+    except Exception:
+        pass
+
+
+def _clear_config_memo() -> None:
+    """
+    Drop the in-process config caches.
+    """
+    _CONFIG_CACHE.clear()
+    _SORTED_REPOS_CACHE.clear()
+
+
+def invalidate_config_cache() -> None:
+    """
+    Drop any cached configuration, in memory and on disk, so the next `load_config()` re-composes it.
+    """
+    _clear_config_memo()
+    try:
+        for path in _config_disk_cache_dir().glob("config-*.yaml"):
+            path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def repos_by_priority(cfg: DictConfig) -> list[Any]:
+    """
+    Return the configured repositories sorted by priority, highest first.
+
+    The sorted list is computed once per config object and shared by later calls, so callers must not mutate it.
+
+    Parameters:
+        cfg (DictConfig): Composed application configuration.
+
+    Returns:
+        list[Any]: Repository configs from `cfg.repos`, in descending priority order.
+    """
+    entry = _SORTED_REPOS_CACHE.get(id(cfg))
+    if entry is not None and entry[0] is cfg:
+        return entry[1]
+    sorted_repos = sorted(
+        cfg.repos.values(),
+        key=attrgetter("priority"),
+        reverse=True,
+    )
+    _SORTED_REPOS_CACHE[id(cfg)] = (cfg, sorted_repos)
+    return sorted_repos
+
+
 def load_config() -> DictConfig:
     """
     Compose and return the application's Hydra configuration.
 
     Merges the packaged config with an optional user config at ~/.prime-directive/config.yaml when present, and expands variables/user home in cfg.system.db_path, cfg.system.log_path, and each repo.path when possible. On failure prints an error, logs it, and exits the process with status code 1.
 
+    The result is cached, in memory and as YAML under ~/.prime-directive/cache, until the packaged config, the user config, or the structured config schema changes on disk (see `invalidate_config_cache`). A warm on-disk cache skips Hydra entirely. The on-disk copy is stored before interpolation and path expansion, which every process applies against its own environment.
+
     Returns:
         DictConfig: The composed Hydra configuration.
     """
+    # Compute absolute path to conf directory relative to this file
+    # pd.py is in prime_directive/bin/, conf is in prime_directive/conf/
+    conf_dir = Path(__file__).parent.parent / "conf"
+    conf_path = str(conf_dir.resolve())
+    user_cfg_path = Path.home() / ".prime-directive" / "config.yaml"
+
+    cache_key = (
+        conf_path,
+        _mtime_ns(conf_dir / "config.yaml"),
+        str(user_cfg_path),
+        _mtime_ns(user_cfg_path),
+        _mtime_ns(conf_dir.parent / "core" / "config.py"),
+    )
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    disk_cache_path = _config_disk_cache_file(cache_key)
+    if disk_cache_path.exists():
+        try:
+            cfg = cast(DictConfig, OmegaConf.load(disk_cache_path))
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache: {e}")
+        else:
+            _expand_config_paths(cfg)
+            _clear_config_memo()
+            _CONFIG_CACHE[cache_key] = cfg
+            return cfg
+
+    # Hydra is only needed to compose a config, so keep it off the import
+    # path of every command and load it on a cache miss.
+    from hydra import compose, initialize_config_dir
+    from hydra.core.global_hydra import GlobalHydra
+
+    from prime_directive.core.config import register_configs
+
     # Ensure any previous Hydra instance is cleared
     GlobalHydra.instance().clear()
 
     # Register structured configs
     register_configs()
 
-    # Compute absolute path to conf directory relative to this file
-    # pd.py is in prime_directive/bin/, conf is in prime_directive/conf/
-    conf_dir = Path(__file__).parent.parent / "conf"
-    conf_path = str(conf_dir.resolve())
-
     try:
         with initialize_config_dir(version_base=None, config_dir=conf_path):
             cfg = compose(config_name="config")
         OmegaConf.set_struct(cfg, False)
 
-        user_cfg_path = Path.home() / ".prime-directive" / "config.yaml"
         if user_cfg_path.exists():
             user_cfg = OmegaConf.load(str(user_cfg_path))
             cfg = cast(DictConfig, OmegaConf.merge(cfg, user_cfg))
 
-        try:
-            cfg.system.db_path = os.path.expanduser(
-                os.path.expandvars(str(cfg.system.db_path))
-            )
-            cfg.system.log_path = os.path.expanduser(
-                os.path.expandvars(str(cfg.system.log_path))
-            )
-        except Exception:
-            pass
-
-        try:
-            for _rid, repo in cfg.repos.items():
-                repo.path = os.path.expanduser(
-                    os.path.expandvars(str(repo.path))
-                )
-        except Exception:
-            pass
+        # Persist the composed config before any interpolation or path
+        # expansion, so the on-disk copy never pins this process's $HOME or
+        # other environment values.
+        _write_config_disk_cache(disk_cache_path, cfg)
+        _expand_config_paths(cfg)
 
+        _clear_config_memo()
+        _CONFIG_CACHE[cache_key] = cfg
         return cfg
     except Exception as e:
         msg = f"Error loading config: {e}"
@@ -174,6 +346,16 @@ def load_config() -> DictConfig:
         sys.exit(1)
 
 
+async def dispose_resources() -> None:
+    """
+    Release the process-wide resources a command may have opened: the shared AI HTTP client and the cached database engines.
+
+    Commands that can call an AI provider await this on exit so pooled keep-alive connections are closed on the loop that opened them.
+    """
+    await dispose_http_client()
+    await dispose_engine()
+
+
 async def _load_recent_snapshot_texts(
     db_path: str,
     limit: int = 100,
@@ -198,27 +380,30 @@ async def _load_recent_snapshot_texts(
     try:
         async for session in get_session(db_path):
             timestamp_col = cast(Any, ContextSnapshot.timestamp)
+            # Project only the short human-authored columns; whole rows
+            # would also drag the terminal capture and AI SITREP text.
             stmt = (
-                select(ContextSnapshot)
+                select(
+                    cast(Any, ContextSnapshot.repo_id),
+                    cast(Any, ContextSnapshot.human_objective),
+                    cast(Any, ContextSnapshot.human_blocker),
+                    cast(Any, ContextSnapshot.human_next_step),
+                    cast(Any, ContextSnapshot.human_note),
+                )
                 .where(timestamp_col >= cutoff)
                 .order_by(timestamp_col.desc())
                 .limit(limit)
             )
             result = await session.execute(stmt)
-            snapshots = list(result.scalars().all())
+            rows = result.all()
             texts: list[str] = []
             repo_ids: set[str] = set()
-            for snapshot in snapshots:
-                repo_ids.add(snapshot.repo_id)
-                for value in [
-                    snapshot.human_objective,
-                    snapshot.human_blocker,
-                    snapshot.human_next_step,
-                    snapshot.human_note,
-                ]:
+            for repo_id, *values in rows:
+                repo_ids.add(repo_id)
+                for value in values:
                     if value and value.strip():
                         texts.append(value)
-            return texts, len(snapshots), len(repo_ids)
+            return texts, len(rows), len(repo_ids)
     finally:
         await dispose_engine()
     return [], 0, 0
@@ -868,72 +1053,81 @@ def dossier_sync_skills(
     deep_repo_count = 0
     deep_cost_line: Optional[str] = None
     if deep:
-        snapshot_texts, deep_snapshot_count, deep_repo_count = asyncio.run(
-            _load_recent_snapshot_texts(cfg.system.db_path)
-        )
-        ai_model = getattr(cfg.system, "ai_model", "qwen2.5-coder")
-        ai_provider = getattr(cfg.system, "ai_provider", "ollama")
-        fallback_provider = getattr(
-            cfg.system,
-            "ai_fallback_provider",
-            "none",
-        )
-        fallback_model = getattr(
-            cfg.system, "ai_fallback_model", "gpt-4o-mini"
-        )
-        require_confirmation = getattr(
-            cfg.system,
-            "ai_require_confirmation",
-            True,
-        )
-        openai_api_url = getattr(
-            cfg.system,
-            "openai_api_url",
-            "https://api.openai.com/v1/chat/completions",
-        )
-        openai_timeout_seconds = getattr(
-            cfg.system, "openai_timeout_seconds", 10.0
-        )
-        openai_max_tokens = getattr(cfg.system, "openai_max_tokens", 150)
-        ollama_api_url = getattr(
-            cfg.system,
-            "ollama_api_url",
-            "http://localhost:11434/api/generate",
-        )
-        ollama_timeout_seconds = getattr(
-            cfg.system, "ollama_timeout_seconds", 5.0
-        )
-        ollama_max_retries = getattr(cfg.system, "ollama_max_retries", 0)
-        ollama_backoff_seconds = getattr(
-            cfg.system, "ollama_backoff_seconds", 0.0
-        )
-        ai_monthly_budget_usd = getattr(
-            cfg.system, "ai_monthly_budget_usd", 10.0
-        )
-        ai_cost_per_1k_tokens = getattr(
-            cfg.system, "ai_cost_per_1k_tokens", 0.002
-        )
-        theme_suggestions, deep_metadata, deep_error = asyncio.run(
-            generate_theme_suggestions_with_ai(
-                snapshot_texts=snapshot_texts,
-                existing_tags=dossier.capabilities.domain_expertise,
-                model=ai_model,
-                provider=ai_provider,
-                fallback_provider=fallback_provider,
-                fallback_model=fallback_model,
-                require_confirmation=require_confirmation,
-                openai_api_url=openai_api_url,
-                openai_timeout_seconds=openai_timeout_seconds,
-                openai_max_tokens=openai_max_tokens,
-                api_url=ollama_api_url,
-                timeout_seconds=ollama_timeout_seconds,
-                max_retries=ollama_max_retries,
-                backoff_seconds=ollama_backoff_seconds,
-                db_path=cfg.system.db_path,
-                monthly_budget_usd=ai_monthly_budget_usd,
-                cost_per_1k_tokens=ai_cost_per_1k_tokens,
+        # Both steps run on one event loop instead of one loop each
+        with event_runner() as runner:
+            snapshot_texts, deep_snapshot_count, deep_repo_count = runner.run(
+                _load_recent_snapshot_texts(cfg.system.db_path)
             )
-        )
+            ai_model = getattr(cfg.system, "ai_model", "qwen2.5-coder")
+            ai_provider = getattr(cfg.system, "ai_provider", "ollama")
+            fallback_provider = getattr(
+                cfg.system,
+                "ai_fallback_provider",
+                "none",
+            )
+            fallback_model = getattr(
+                cfg.system, "ai_fallback_model", "gpt-4o-mini"
+            )
+            require_confirmation = getattr(
+                cfg.system,
+                "ai_require_confirmation",
+                True,
+            )
+            openai_api_url = getattr(
+                cfg.system,
+                "openai_api_url",
+                "https://api.openai.com/v1/chat/completions",
+            )
+            openai_timeout_seconds = getattr(
+                cfg.system, "openai_timeout_seconds", 10.0
+            )
+            openai_max_tokens = getattr(cfg.system, "openai_max_tokens", 150)
+            ollama_api_url = getattr(
+                cfg.system,
+                "ollama_api_url",
+                "http://localhost:11434/api/generate",
+            )
+            ollama_timeout_seconds = getattr(
+                cfg.system, "ollama_timeout_seconds", 5.0
+            )
+            ollama_max_retries = getattr(cfg.system, "ollama_max_retries", 0)
+            ollama_backoff_seconds = getattr(
+                cfg.system, "ollama_backoff_seconds", 0.0
+            )
+            ollama_max_backoff_seconds = getattr(
+                cfg.system, "ollama_max_backoff_seconds", 30.0
+            )
+            ai_monthly_budget_usd = getattr(
+                cfg.system, "ai_monthly_budget_usd", 10.0
+            )
+            ai_cost_per_1k_tokens = getattr(
+                cfg.system, "ai_cost_per_1k_tokens", 0.002
+            )
+            try:
+                theme_suggestions, deep_metadata, deep_error = runner.run(
+                    generate_theme_suggestions_with_ai(
+                        snapshot_texts=snapshot_texts,
+                        existing_tags=dossier.capabilities.domain_expertise,
+                        model=ai_model,
+                        provider=ai_provider,
+                        fallback_provider=fallback_provider,
+                        fallback_model=fallback_model,
+                        require_confirmation=require_confirmation,
+                        openai_api_url=openai_api_url,
+                        openai_timeout_seconds=openai_timeout_seconds,
+                        openai_max_tokens=openai_max_tokens,
+                        api_url=ollama_api_url,
+                        timeout_seconds=ollama_timeout_seconds,
+                        max_retries=ollama_max_retries,
+                        backoff_seconds=ollama_backoff_seconds,
+                        db_path=cfg.system.db_path,
+                        monthly_budget_usd=ai_monthly_budget_usd,
+                        cost_per_1k_tokens=ai_cost_per_1k_tokens,
+                        max_backoff_seconds=ollama_max_backoff_seconds,
+                    )
+                )
+            finally:
+                runner.run(dispose_resources())
         if deep_error is not None:
             console.print(
                 f"[bold red]Deep analysis error:[/bold red] {deep_error}"
@@ -1412,56 +1606,72 @@ async def freeze_logic(
     active_task = get_active_task(repo_path)
     logger.debug(f"Active task: {active_task}")
 
-    # 4. Generate AI SITREP (Blocking Network Call - could be made async
-    # with httpx)
+    # 4. Generate AI SITREP (network call). Database setup does not depend
+    # on it, so run schema init concurrently to hide it behind the AI RTT.
     console.print("Generating AI SITREP...")
-    if config.system.mock_mode:
-        logger.info("MOCK MODE: Skipping AI generation")
-        sitrep = "MOCK: SITREP generated without AI."
-    else:
-        if use_hq_model:
-            selected_model = getattr(
-                config.system,
-                "ai_model_hq",
-                config.system.ai_model,
-            )
-            selected_provider = "openai"
+    db_ready = asyncio.create_task(init_db(config.system.db_path))
+    try:
+        if config.system.mock_mode:
+            logger.info("MOCK MODE: Skipping AI generation")
+            sitrep = "MOCK: SITREP generated without AI."
         else:
-            selected_model = config.system.ai_model
-            selected_provider = config.system.ai_provider
-
-        monthly_budget = getattr(config.system, "ai_monthly_budget_usd", 10.0)
-        cost_per_1k = getattr(config.system, "ai_cost_per_1k_tokens", 0.002)
-
-        sitrep = await generate_sitrep(
-            repo_id=repo_id,
-            git_state=git_summary,
-            terminal_logs=term_output,
-            active_task=active_task,
-            human_objective=human_objective,
-            human_blocker=human_blocker,
-            human_next_step=human_next_step,
-            human_note=human_note,
-            model=selected_model,
-            provider=selected_provider,
-            fallback_provider=config.system.ai_fallback_provider,
-            fallback_model=config.system.ai_fallback_model,
-            require_confirmation=config.system.ai_require_confirmation,
-            openai_api_url=config.system.openai_api_url,
-            openai_timeout_seconds=config.system.openai_timeout_seconds,
-            openai_max_tokens=config.system.openai_max_tokens,
-            api_url=config.system.ollama_api_url,
-            timeout_seconds=config.system.ollama_timeout_seconds,
-            max_retries=config.system.ollama_max_retries,
-            backoff_seconds=config.system.ollama_backoff_seconds,
-            db_path=config.system.db_path,
-            monthly_budget_usd=monthly_budget,
-            cost_per_1k_tokens=cost_per_1k,
-        )
+            if use_hq_model:
+                selected_model = getattr(
+                    config.system,
+                    "ai_model_hq",
+                    config.system.ai_model,
+                )
+                selected_provider = "openai"
+            else:
+                selected_model = config.system.ai_model
+                selected_provider = config.system.ai_provider
+
+            monthly_budget = getattr(
+                config.system, "ai_monthly_budget_usd", 10.0
+            )
+            cost_per_1k = getattr(
+                config.system, "ai_cost_per_1k_tokens", 0.002
+            )
+
+            sitrep = await generate_sitrep(
+                repo_id=repo_id,
+                git_state=git_summary,
+                terminal_logs=term_output,
+                active_task=active_task,
+                human_objective=human_objective,
+                human_blocker=human_blocker,
+                human_next_step=human_next_step,
+                human_note=human_note,
+                model=selected_model,
+                provider=selected_provider,
+                fallback_provider=config.system.ai_fallback_provider,
+                fallback_model=config.system.ai_fallback_model,
+                require_confirmation=config.system.ai_require_confirmation,
+                openai_api_url=config.system.openai_api_url,
+                openai_timeout_seconds=config.system.openai_timeout_seconds,
+                openai_max_tokens=config.system.openai_max_tokens,
+                api_url=config.system.ollama_api_url,
+                timeout_seconds=config.system.ollama_timeout_seconds,
+                max_retries=config.system.ollama_max_retries,
+                backoff_seconds=config.system.ollama_backoff_seconds,
+                max_backoff_seconds=getattr(
+                    config.system, "ollama_max_backoff_seconds", 30.0
+                ),
+                db_path=config.system.db_path,
+                monthly_budget_usd=monthly_budget,
+                cost_per_1k_tokens=cost_per_1k,
+            )
+    except BaseException:
+        db_ready.cancel()
+        # Wait for the cancellation to land (init_db shields its migration
+        # future and re-awaits it) and retrieve whatever the task ended
+        # with, so nothing is left pending or unretrieved.
+        await asyncio.gather(db_ready, return_exceptions=True)
+        raise
     logger.info(f"Generated SITREP for {repo_id}")
 
     # 5. Save to DB (Async)
-    await init_db(config.system.db_path)
+    await db_ready
     async for session in get_session(config.system.db_path):
         # Ensure Repository exists (FK constraint)
         from sqlalchemy import select as sql_select
@@ -1482,21 +1692,27 @@ async def freeze_logic(
             session.add(new_repo)
             await session.flush()
 
-        snapshot = ContextSnapshot(
-            repo_id=repo_id,
-            timestamp=datetime.now(timezone.utc),
-            git_status_summary=git_summary,
-            terminal_last_command=last_cmd,
-            terminal_output_summary=term_output,
-            ai_sitrep=sitrep,
-            human_note=human_note,
-            human_objective=human_objective,
-            human_blocker=human_blocker,
-            human_next_step=human_next_step,
+        # Core INSERT ... RETURNING: the new id comes back with the insert
+        # instead of a post-commit refresh of an ORM instance.
+        snapshot_stmt = (
+            insert(ContextSnapshot)
+            .values(
+                repo_id=repo_id,
+                timestamp=datetime.now(timezone.utc),
+                git_status_summary=git_summary,
+                terminal_last_command=last_cmd,
+                terminal_output_summary=term_output,
+                ai_sitrep=sitrep,
+                human_note=human_note,
+                human_objective=human_objective,
+                human_blocker=human_blocker,
+                human_next_step=human_next_step,
+            )
+            .returning(cast(Any, ContextSnapshot.id))
         )
-        session.add(snapshot)
+        snapshot_id = (await session.execute(snapshot_stmt)).scalar_one()
         await session.commit()
-        msg = f"Snapshot saved. ID: {snapshot.id}"
+        msg = f"Snapshot saved. ID: {snapshot_id}"
         console.print(f"[bold green]{msg}[/bold green]")
         if human_objective:
             console.print(
@@ -1629,9 +1845,9 @@ def freeze(
         except ValueError:
             raise typer.Exit(code=1) from None
         finally:
-            await dispose_engine()
+            await dispose_resources()
 
-    asyncio.run(run_freeze())
+    run_async(run_freeze())
 
 
 @app.command("switch")
@@ -1657,7 +1873,7 @@ def switch(repo_id: str):
         launch_editor_fn=launch_editor,
         init_db_fn=init_db,
         get_session_fn=get_session,
-        dispose_engine_fn=dispose_engine,
+        dispose_engine_fn=dispose_resources,
         console=console,
         logger=logger,
     )
@@ -1757,7 +1973,7 @@ def internal_log_commit(repo_id: str):
         finally:
             await dispose_engine()
 
-    asyncio.run(run_internal())
+    run_async(run_internal())
 
 
 def _format_seconds(seconds: float) -> str:
@@ -1861,7 +2077,7 @@ def metrics(repo_id: Optional[str] = typer.Option(None, "--repo")):
         finally:
             await dispose_engine()
 
-    asyncio.run(run_metrics())
+    run_async(run_metrics())
 
 
 @app.command("list")
@@ -1882,11 +2098,7 @@ def list_repos():
     table.add_column("Path", style="yellow")
 
     # Sort by priority descending
-    sorted_repos = sorted(
-        cfg.repos.values(),
-        key=lambda r: r.priority,
-        reverse=True,
-    )
+    sorted_repos = repos_by_priority(cfg)
 
     for repo in sorted_repos:
         table.add_row(
@@ -1898,6 +2110,37 @@ def list_repos():
     console.print(table)
 
 
+async def _fetch_last_snapshot_times(
+    session: Any,
+    repo_ids: list[str],
+) -> dict[str, datetime]:
+    """
+    Fetch the most recent snapshot timestamp for each of the given repositories in one query.
+
+    Parameters:
+        session (AsyncSession): Open database session to run the query on.
+        repo_ids (list[str]): Repository identifiers to look up.
+
+    Returns:
+        dict[str, datetime]: Mapping of repository id to its latest snapshot timestamp; repositories without snapshots are absent.
+    """
+    if not repo_ids:
+        return {}
+    repo_id_col = cast(Any, ContextSnapshot.repo_id)
+    timestamp_col = cast(Any, ContextSnapshot.timestamp)
+    stmt = (
+        select(repo_id_col, func.max(timestamp_col))
+        .where(repo_id_col.in_(repo_ids))
+        .group_by(repo_id_col)
+    )
+    result = await session.execute(stmt)
+    return {
+        repo_id: timestamp
+        for repo_id, timestamp in result.all()
+        if timestamp is not None
+    }
+
+
 @app.command("status")
 def status_command():
     """Show detailed status of all repositories."""
@@ -1912,11 +2155,7 @@ def status_command():
     table.add_column("Git Status", style="bold")
     table.add_column("Last Snapshot", style="blue")
 
-    sorted_repos = sorted(
-        cfg.repos.values(),
-        key=lambda r: r.priority,
-        reverse=True,
-    )
+    sorted_repos = repos_by_priority(cfg)
 
     async def run_status():
         """
@@ -1924,24 +2163,43 @@ def status_command():
 
         This coroutine initializes the database, iterates configured repositories, obtains each repository's git status and most recent ContextSnapshot timestamp, and adds a row to the shared table containing repository id, priority, branch, git status, and last snapshot time. The database engine is always disposed when finished.
         """
+        git_slots = asyncio.Semaphore(_MAX_CONCURRENT_GIT_STATUS)
+
+        async def repo_git_status(repo: Any) -> Any:
+            """
+            Return the git status for a repository, or a placeholder in mock mode.
+            """
+            if cfg.system.mock_mode:
+                return {
+                    "branch": "mock",
+                    "is_dirty": False,
+                    "uncommitted_files": [],
+                }
+            async with git_slots:
+                return await get_status(repo.path)
+
         try:
             # Ensure DB exists/tables created
             await init_db(cfg.system.db_path)
 
             async for session in get_session(cfg.system.db_path):
-                # We can reuse this session for all queries
-
-                for repo in sorted_repos:
-                    # 1. Git Status (Sync)
-                    if cfg.system.mock_mode:
-                        git_st = {
-                            "branch": "mock",
-                            "is_dirty": False,
-                            "uncommitted_files": [],
-                        }
-                    else:
-                        git_st = await get_status(repo.path)
+                # One grouped query for every repo's latest snapshot
+                last_snapshots: dict[str, datetime] = {}
+                snapshot_error: Optional[str] = None
+                try:
+                    last_snapshots = await _fetch_last_snapshot_times(
+                        session, [repo.id for repo in sorted_repos]
+                    )
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Error fetching snapshots: {e}")
+                    snapshot_error = "Error"
+
+                # 1. Git Status: git subprocesses for all repos overlap
+                git_states = await asyncio.gather(
+                    *(repo_git_status(repo) for repo in sorted_repos)
+                )
 
+                for repo, git_st in zip(sorted_repos, git_states):
                     status_icon = "🟢"
                     status_text = "Clean"
                     if git_st["is_dirty"]:
@@ -1960,25 +2218,14 @@ def status_command():
 
                     git_display = f"{status_icon} {status_text}"
 
-                    # 2. Last Snapshot (Async)
-                    last_snap_str = "Never"
-                    try:
-                        stmt = (
-                            select(ContextSnapshot)
-                            .where(ContextSnapshot.repo_id == repo.id)
-                            .order_by(ContextSnapshot.timestamp.desc())
-                            .limit(1)
-                        )
-                        result = await session.execute(stmt)
-                        snapshot = result.scalars().first()
-                        if snapshot:
-                            ts_fmt = "%Y-%m-%d %H:%M"
-                            last_snap_str = snapshot.timestamp.strftime(ts_fmt)
-                    except (OSError, ValueError) as e:
-                        logger.warning(
-                            f"Error fetching snapshot for {repo.id}: {e}"
-                        )
-                        last_snap_str = "Error"
+                    # 2. Last Snapshot
+                    last_snap = last_snapshots.get(repo.id)
+                    if snapshot_error:
+                        last_snap_str = snapshot_error
+                    elif last_snap is not None:
+                        last_snap_str = _format_minutes(last_snap)
+                    else:
+                        last_snap_str = "Never"
 
                     if repo.priority >= 8:
                         priority_prefix = "🔥"
@@ -2000,7 +2247,7 @@ def status_command():
         finally:
             await dispose_engine()
 
-    asyncio.run(run_status())
+    run_async(run_status())
     console.print(table)
 
 
@@ -2122,17 +2369,20 @@ def sitrep(
                 chars_used = 0
                 # Iterate newest-first so the budget keeps recent context
                 for i, snap in enumerate(snapshots):
-                    entry = f"--- Snapshot ({snap.timestamp}) ---\n"
+                    # Collect fragments and join once; repeated `+=` on
+                    # long ai_sitrep fields copies the entry every step.
+                    parts = [f"--- Snapshot ({snap.timestamp}) ---\n"]
                     if snap.human_objective:
-                        entry += f"Objective: {snap.human_objective}\n"
+                        parts.append(f"Objective: {snap.human_objective}\n")
                     if snap.human_blocker:
-                        entry += f"Blocker: {snap.human_blocker}\n"
+                        parts.append(f"Blocker: {snap.human_blocker}\n")
                     if snap.human_next_step:
-                        entry += f"Next Step: {snap.human_next_step}\n"
+                        parts.append(f"Next Step: {snap.human_next_step}\n")
                     if snap.human_note:
-                        entry += f"Notes: {snap.human_note}\n"
-                    entry += f"AI Summary: {snap.ai_sitrep}\n"
-                    entry += f"Git State: {snap.git_status_summary}\n"
+                        parts.append(f"Notes: {snap.human_note}\n")
+                    parts.append(f"AI Summary: {snap.ai_sitrep}\n")
+                    parts.append(f"Git State: {snap.git_status_summary}\n")
+                    entry = "".join(parts)
                     if chars_used + len(entry) > _MAX_NARRATIVE_CHARS:
                         omitted = len(snapshots) - i
                         history_entries.append(
@@ -2147,9 +2397,11 @@ def sitrep(
                 historical_narrative = "\n".join(history_entries)
 
                 # Generate longitudinal summary using HQ model
+                import httpx
+
                 from prime_directive.core.ai_providers import (
-                    generate_openai_chat,
                     get_openai_api_key,
+                    stream_openai_chat,
                 )
 
                 api_key = get_openai_api_key()
@@ -2189,7 +2441,7 @@ effectively.
 
                 hq_model = getattr(cfg.system, "ai_model_hq", "gpt-4o")
                 try:
-                    summary = await generate_openai_chat(
+                    summary_stream = stream_openai_chat(
                         api_url=cfg.system.openai_api_url,
                         api_key=api_key,
                         model=hq_model,
@@ -2199,6 +2451,8 @@ effectively.
                         max_tokens=500,
                     )
 
+                    # Render the header up front and stream the summary
+                    # so the user sees text at first token, not at the end.
                     console.print(
                         f"\n[bold reverse] DEEP-DIVE SITREP for {repo_id} "
                         "[/bold reverse]"
@@ -2213,16 +2467,25 @@ effectively.
                         f"{time_span}"
                         "[/dim]"
                     )
-                    console.print(f"\n[bold cyan]{summary}[/bold cyan]")
+                    console.print()
+                    async for chunk in summary_stream:
+                        console.print(
+                            chunk,
+                            end="",
+                            style="bold cyan",
+                            markup=False,
+                            highlight=False,
+                        )
+                    console.print()
                 except (httpx.HTTPError, ValueError, OSError) as e:
                     console.print(
                         "[bold red]Error generating deep-dive:[/bold red] "
                         f"{e}"
                     )
         finally:
-            await dispose_engine()
+            await dispose_resources()
 
-    asyncio.run(run_sitrep())
+    run_async(run_sitrep())
 
 
 @app.command("ai-usage")
@@ -2236,8 +2499,7 @@ def ai_usage():
     cfg = load_config()
     setup_logging(cfg.system.log_path)
 
-    from prime_directive.core.ai_providers import get_monthly_usage
-    from prime_directive.core.db import AIUsageLog
+    from prime_directive.core.ai_providers import get_usage_report
 
     async def run_usage():
         """
@@ -2249,13 +2511,13 @@ def ai_usage():
         """
         await init_db(cfg.system.db_path)
         try:
-            # Get monthly totals
-            total_cost, call_count = await get_monthly_usage(
-                cfg.system.db_path
+            # Monthly totals and recent calls in one round-trip
+            total_cost, call_count, recent = await get_usage_report(
+                cfg.system.db_path, limit=10
             )
             budget = getattr(cfg.system, "ai_monthly_budget_usd", 10.0)
             remaining = max(0, budget - total_cost)
-            pct_used = (total_cost / budget * 100) if budget > 0 else 0
+            pct_used = 100.0 * total_cost / budget if budget > 0 else 0.0
 
             console.print("\n[bold reverse] AI Usage Report [/bold reverse]")
             console.print("[bold]Month-to-Date (OpenAI):[/bold]")
@@ -2266,79 +2528,54 @@ def ai_usage():
                 f"  Remaining: ${remaining:.4f} ({100-pct_used:.1f}%)"
             )
 
-            if pct_used >= 90:
-                console.print(
-                    "  [bold red]⚠️  "
-                    f"{pct_used:.1f}% of budget used!"
-                    "[/bold red]"
-                )
-            elif pct_used >= 75:
-                console.print(
-                    "  [bold yellow]⚠️  "
-                    f"{pct_used:.1f}% of budget used"
-                    "[/bold yellow]"
-                )
-            else:
-                console.print(
-                    "  [green]✅ " f"{pct_used:.1f}% of budget used" "[/green]"
-                )
+            band = next(
+                template
+                for threshold, template in _BUDGET_STATUS_BANDS
+                if pct_used >= threshold
+            )
+            console.print(band.format(pct=pct_used))
 
             # Show recent calls
-            async for session in get_session(cfg.system.db_path):
-                now = datetime.now(timezone.utc)
-                month_start = now.replace(
-                    day=1,
-                    hour=0,
-                    minute=0,
-                    second=0,
-                    microsecond=0,
-                )
-
-                ts_col = cast(Any, AIUsageLog.timestamp)
-                stmt = (
-                    select(AIUsageLog)
-                    .where(ts_col >= month_start)
-                    .order_by(ts_col.desc())
-                    .limit(10)
-                )
-                result = await session.execute(stmt)
-                recent = list(result.scalars().all())
-
-                if recent:
-                    console.print("\n[bold]Recent Calls:[/bold]")
-                    table = Table(show_header=True)
-                    table.add_column("Time", style="dim")
-                    table.add_column("Provider")
-                    table.add_column("Model")
-                    table.add_column("Tokens")
-                    table.add_column("Cost")
-                    table.add_column("Status")
-
-                    for log in recent:
-                        status = (
-                            "[green]✓[/green]"
-                            if log.success
-                            else "[red]✗[/red]"
-                        )
-                        table.add_row(
-                            log.timestamp.strftime("%m-%d %H:%M"),
-                            log.provider,
-                            log.model,
-                            str(log.output_tokens),
-                            f"${log.cost_estimate_usd:.4f}",
-                            status,
-                        )
-                    console.print(table)
-                break
+            if recent:
+                console.print("\n[bold]Recent Calls:[/bold]")
+                table = Table(show_header=True)
+                table.add_column("Time", style="dim")
+                table.add_column("Provider")
+                table.add_column("Model")
+                table.add_column("Tokens")
+                table.add_column("Cost")
+                table.add_column("Status")
+
+                for log in recent:
+                    status = (
+                        "[green]✓[/green]" if log.success else "[red]✗[/red]"
+                    )
+                    table.add_row(
+                        # "MM-DD HH:MM"
+                        _format_minutes(log.timestamp)[5:],
+                        log.provider,
+                        log.model,
+                        str(log.output_tokens),
+                        f"${log.cost_estimate_usd:.4f}",
+                        status,
+                    )
+                console.print(table)
         finally:
             await dispose_engine()
 
-    asyncio.run(run_usage())
+    run_async(run_usage())
 
 
 @app.command("doctor")
 def doctor():
     """Diagnose system dependencies and configuration."""
+    # Dependency probes pull in the HTTP stack; only doctor needs them.
+    from prime_directive.core.dependencies import (
+        close_http_client,
+        get_ollama_status,
+        has_openai_api_key,
+    )
+
     logger.info("Command: doctor")
     cfg = load_config()
     setup_logging(cfg.system.log_path)
@@ -2348,12 +2585,36 @@ def doctor():
         console.print("[bold yellow]MOCK MODE ENABLED[/bold yellow]")
 
     checks = []
+    repos = list(cfg.repos.values())
+    editor_cmd = cfg.system.editor_cmd
+
+    # The probes are independent; run them together so the Ollama round-trip
+    # overlaps the PATH lookups and filesystem stats. Each distinct path and
+    # command is probed once, however many repos or checks share it.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        exists_futures = {
+            path: executor.submit(os.path.exists, path)
+            for path in dict.fromkeys(repo.path for repo in repos)
+        }
+        if not cfg.system.mock_mode:
+            which_futures = {
+                cmd: executor.submit(shutil.which, cmd)
+                for cmd in dict.fromkeys(("tmux", editor_cmd))
+            }
+            tmux_future = which_futures["tmux"]
+            editor_future = which_futures[editor_cmd]
+            ollama_future = executor.submit(
+                get_ollama_status, cfg.system.ai_model
+            )
+    # Leaving the executor waited for the Ollama probe, the only user of
+    # the shared sync client, so its connections can be released now.
+    close_http_client()
 
     # 1. Tmux
     if cfg.system.mock_mode:
         checks.append(("Tmux Installed", "✅", "Mocked"))
     else:
-        tmux_path = shutil.which("tmux")
+        tmux_path = tmux_future.result()
         checks.append(
             (
                 "Tmux Installed",
@@ -2366,8 +2627,7 @@ def doctor():
     if cfg.system.mock_mode:
         checks.append((f"Editor ({cfg.system.editor_cmd})", "✅", "Mocked"))
     else:
-        editor_cmd = cfg.system.editor_cmd
-        editor_path = shutil.which(editor_cmd)
+        editor_path = editor_future.result()
         checks.append(
             (
                 f"Editor ({editor_cmd})",
@@ -2380,7 +2640,7 @@ def doctor():
     if cfg.system.mock_mode:
         checks.append(("AI Engine (Ollama)", "✅", "Mocked"))
     else:
-        ollama = get_ollama_status(cfg.system.ai_model)
+        ollama = ollama_future.result()
         if not ollama.installed:
             ai_status = "❌"
             ai_msg = f"{ollama.details}. Install: {ollama.install_cmd}"
@@ -2467,8 +2727,8 @@ def doctor():
 
     # 4. Registry Paths
     console.print("\n[bold]Checking Repositories:[/bold]")
-    for repo in cfg.repos.values():
-        exists = os.path.exists(repo.path)
+    for repo in repos:
+        exists = exists_futures[repo.path].result()
         icon = "✅" if exists else "❌"
         console.print(f"  {icon} {repo.id}: {repo.path}")
         if not exists:
@@ -1,20 +1,55 @@
 import asyncio
+import heapq
 import os
 import shutil
 import subprocess
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
 import typer
 from rich.console import Console
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import (
+    DirCreatedEvent,
+    DirDeletedEvent,
+    DirMovedEvent,
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
 from prime_directive.bin.pd import freeze_logic, load_config
+from prime_directive.core.ai_providers import dispose_http_client
 from prime_directive.core.db import dispose_engine
+from prime_directive.core.event_loop import run_async
+from prime_directive.core.logging_utils import setup_logging
 
 app = typer.Typer()
 console = Console()
 
+# Directory names whose churn never counts as user activity.
+_IGNORED_DIR_NAMES = frozenset(
+    {".git", "node_modules", ".venv", "venv", "__pycache__", ".mypy_cache"}
+)
+# Minimum spacing between recorded activity updates for one handler.
+_ACTIVITY_THROTTLE_SECONDS = 1.0
+# Events that count as editing. Passed to the observer so backends such as
+# inotify never subscribe to open/close/access; directory events keep the
+# recursive watch in step with new and removed subdirectories.
+_ACTIVITY_EVENT_TYPES = [
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileDeletedEvent,
+    FileMovedEvent,
+    DirCreatedEvent,
+    DirDeletedEvent,
+    DirMovedEvent,
+]
+
 
 def _is_ide_environment() -> bool:
     """
@@ -37,27 +72,24 @@ def _tmux_session_has_active_clients(session_name: str) -> bool:
     """
     Determine whether a tmux session has any attached clients.
 
+    A single `tmux list-clients` call answers both questions: it fails when the session does not exist and prints one line per attached client otherwise.
+
     Returns:
         True if the tmux executable is available, the named session exists, and it has at least one attached client; False if tmux is unavailable, the session does not exist, the session has no clients, or if command timeouts/errors occur.
     """
     if not shutil.which("tmux"):
         return False
 
-    try:
-        result = subprocess.run(
-            ["tmux", "has-session", "-t", session_name],
-            capture_output=True,
-            timeout=2,
-        )
-    except subprocess.TimeoutExpired:
-        return False
-
-    if result.returncode != 0:
-        return False
-
     try:
         clients = subprocess.run(
-            ["tmux", "list-clients", "-t", session_name],
+            [
+                "tmux",
+                "list-clients",
+                "-t",
+                session_name,
+                "-F",
+                "#{client_tty}",
+            ],
             capture_output=True,
             timeout=2,
         )
@@ -87,66 +119,194 @@ def _should_skip_terminal_capture(repo_id: str) -> bool:
     return not _tmux_session_has_active_clients(session_name)
 
 
+def _is_ignored_path(path: str, root: Optional[str] = None) -> bool:
+    """
+    Determine whether a filesystem event path lies inside an ignored directory.
+
+    Parameters:
+        path (str): Path reported by the watchdog event.
+        root (Optional[str]): Repository root; when given, only components below it are checked.
+
+    Returns:
+        `True` if any directory component of the path is in `_IGNORED_DIR_NAMES`, `False` otherwise.
+    """
+    if root is not None:
+        path = os.path.relpath(path, root)
+    parts = os.path.normpath(path).split(os.sep)
+    return not _IGNORED_DIR_NAMES.isdisjoint(parts[:-1])
+
+
+def _make_observer(polling: bool, interval: float):
+    """
+    Create the filesystem observer shared by all repository handlers.
+
+    watchdog's `Observer` resolves to the native backend for the platform (inotify, FSEvents, kqueue or ReadDirectoryChangesW) and silently falls back to polling where none is available. Polling, whether requested or a fallback, rescans every `interval` seconds instead of watchdog's 1-second default, since inactivity is measured in minutes.
+
+    Parameters:
+        polling (bool): Force a `PollingObserver` even when a native backend exists.
+        interval (float): Seconds between polling rescans.
+
+    Returns:
+        BaseObserver: An unstarted observer.
+    """
+    if polling:
+        return PollingObserver(timeout=interval)
+    if Observer is PollingObserver:
+        console.print(
+            "[yellow]No native file watching backend available; "
+            f"polling every {interval}s.[/yellow]"
+        )
+        return PollingObserver(timeout=interval)
+    return Observer()
+
+
+async def _wait_for_activity(
+    wake: asyncio.Event, timeout: Optional[float]
+) -> None:
+    """
+    Wait until `wake` is set or `timeout` seconds pass, then clear `wake`.
+
+    Parameters:
+        wake (asyncio.Event): Event set when a frozen repository sees activity.
+        timeout (Optional[float]): Maximum seconds to wait; None waits indefinitely.
+    """
+    try:
+        await asyncio.wait_for(wake.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    wake.clear()
+
+
 class AutoFreezeHandler(FileSystemEventHandler):
-    def __init__(self, repo_id: str, cfg):
+    def __init__(self, repo_id: str, cfg, repo_path: Optional[str] = None):
         """
         Initialize an AutoFreezeHandler for a repository.
 
         Parameters:
             repo_id (str): Identifier of the repository being monitored.
             cfg: Configuration object containing repository settings and runtime options.
+            repo_path (Optional[str]): Repository root; when given, ignored directories are matched only below it.
 
         Notes:
-            - Sets `last_modified` to the current time and `is_frozen` to False.
+            - Sets `last_modified` to the current `time.monotonic()` reading and `is_frozen` to False.
+            - Activity is recorded at most once per `_ACTIVITY_THROTTLE_SECONDS`.
+            - `on_unfreeze`, when set, is called (on the observer thread) the first time activity follows a freeze.
         """
         self.repo_id = repo_id
         self.cfg = cfg
-        self.last_modified = datetime.now()
+        self.repo_path = repo_path
+        # Monotonic seconds: cheap to read on every event and immune to
+        # wall-clock jumps (NTP, suspend/resume) when measuring inactivity.
+        self.last_modified = time.monotonic()
         self.is_frozen = False
-
-    def on_any_event(self, event):
+        self._next_update = 0.0
+        # Called from the observer thread when activity unfreezes the repo
+        self.on_unfreeze: Optional[Callable[[], None]] = None
+
+    def _record_activity(self, event):
+        # A single save fires several events; record activity once per window.
+        # Checked first: it is the cheapest test and rejects most events.
+        now = time.monotonic()
+        if now < self._next_update:
+            return
         if event.is_directory:
             return
+        if _is_ignored_path(event.src_path, self.repo_path):
+            return
+        self._next_update = now + _ACTIVITY_THROTTLE_SECONDS
         # Activity detected, reset state
-        self.last_modified = datetime.now()
+        self.last_modified = now
         if self.is_frozen:
             # console.print(
             #     f"[green]Activity detected in {self.repo_id}. "
             #     "Unfreezing state...[/green]"
             # )
             self.is_frozen = False
+            if self.on_unfreeze is not None:
+                self.on_unfreeze()
+
+    # Only content changes count; opening or reading a file (IDE indexing,
+    # `git status`) must not keep a repository awake.
+    on_created = _record_activity
+    on_modified = _record_activity
+    on_deleted = _record_activity
+    on_moved = _record_activity
+
+
+def daemon_log_path(log_path: str) -> str:
+    """
+    Return the daemon's log file: `pd-daemon.log` next to the CLI log.
+
+    Parameters:
+        log_path (str): The configured `system.log_path` of the CLI.
+
+    Returns:
+        str: Path of the daemon's own log file.
+    """
+    return os.path.join(
+        os.path.dirname(os.path.expanduser(log_path)), "pd-daemon.log"
+    )
 
 
 @app.command()
 def main(
     interval: int = typer.Option(
         300,
-        help="Check interval in seconds",
+        help="Retry delay after a failed freeze, and rescan interval "
+        "with --polling, in seconds",
     ),
     inactivity_limit: int = typer.Option(
         1800,
         help="Inactivity limit in seconds (30 min)",
     ),
+    polling: bool = typer.Option(
+        False,
+        "--polling",
+        help="Poll for changes instead of using kernel watches "
+        "(for network filesystems or very deep trees)",
+    ),
 ):
     """
     Run a background daemon that monitors configured repositories and auto-freezes repository context after sustained inactivity.
 
     Parameters:
-        interval (int): Polling interval in seconds between inactivity checks.
+        interval (int): Seconds before retrying a failed freeze, and between rescans when polling.
         inactivity_limit (int): Inactivity threshold in seconds after which a repository will be frozen.
+        polling (bool): If True, use a `PollingObserver` that rescans every `interval` seconds instead of registering an inotify watch per directory.
     """
     msg = "[bold green]Starting Prime Directive Daemon...[/bold green]"
     console.print(msg)
     cfg = load_config()
-    observer = Observer()
+    # The daemon outlives every CLI run, so it logs to its own file and is
+    # the only process that rotates it; pd.log stays append-only.
+    setup_logging(daemon_log_path(cfg.system.log_path), rotate=True)
+    # One observer is shared by every repository handler.
+    observer = _make_observer(polling, interval)
     handlers = {}
 
-    for repo_id, repo_config in cfg.repos.items():
-        if os.path.exists(repo_config.path):
+    repos = list(cfg.repos.items())
+    # Stat every repository root together; on network mounts each check is
+    # a round-trip and a serial loop would add them up.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        found = list(
+            executor.map(
+                os.path.exists, [repo.path for _repo_id, repo in repos]
+            )
+        )
+
+    for (repo_id, repo_config), exists in zip(repos, found):
+        if exists:
             console.print(f"Monitoring {repo_id} at {repo_config.path}")
-            handler = AutoFreezeHandler(repo_id, cfg)
+            handler = AutoFreezeHandler(
+                repo_id, cfg, repo_path=repo_config.path
+            )
             handlers[repo_id] = handler
-            observer.schedule(handler, repo_config.path, recursive=True)
+            observer.schedule(
+                handler,
+                repo_config.path,
+                recursive=True,
+                event_filter=_ACTIVITY_EVENT_TYPES,
+            )
         else:
             console.print(
                 f"[yellow]Skipping {repo_id}: Path not found[/yellow]"
@@ -156,60 +316,114 @@ def main(
 
     async def run_freeze(repo_id, cfg):
         """
-        Run the freeze process for the given repository and ensure the database engine is disposed afterwards.
+        Run the freeze process for the given repository.
+
+        The database engine is kept open between freezes and disposed when the daemon loop exits.
 
         Parameters:
             repo_id (str): Repository identifier to freeze.
             cfg: Configuration object passed to the freeze logic.
         """
-        try:
-            skip_terminal_capture = _should_skip_terminal_capture(repo_id)
-            if skip_terminal_capture:
-                console.print(
-                    f"[yellow]Skipping terminal capture for {repo_id}[/yellow]"
-                )
-            await freeze_logic(
-                repo_id,
-                cfg,
-                skip_terminal_capture=skip_terminal_capture,
+        skip_terminal_capture = _should_skip_terminal_capture(repo_id)
+        if skip_terminal_capture:
+            console.print(
+                f"[yellow]Skipping terminal capture for {repo_id}[/yellow]"
             )
-        finally:
-            await dispose_engine()
+        await freeze_logic(
+            repo_id,
+            cfg,
+            skip_terminal_capture=skip_terminal_capture,
+        )
 
     async def daemon_loop() -> None:
         """
-        Run an infinite background loop that periodically checks repositories for inactivity and triggers freezing when inactivity exceeds the configured limit.
+        Run an infinite background loop that freezes repositories once they have been inactive for longer than inactivity_limit.
 
-        For each tracked repository, if the time since its last filesystem event is greater than inactivity_limit and it is not already frozen, this function calls run_freeze(repo_id, cfg); on success it marks the handler as frozen and logs the change. If run_freeze raises OSError or ValueError, the exception is caught and logged.
+        Repositories are kept in a min-heap keyed by the monotonic time at which they would next become stale, and the loop sleeps until the earliest such deadline rather than scanning every handler on a fixed tick. Expired entries are re-checked against the handler's current `last_modified` (activity may have pushed the deadline back) before run_freeze(repo_id, cfg) is called; all repositories that are due in the same wake-up are frozen concurrently, and each handler is marked frozen on success. Frozen repositories leave the heap and are re-added by their handler's `on_unfreeze` hook when activity resumes, so a daemon whose repositories are all frozen sleeps until the next edit. Repositories whose freeze raised OSError or ValueError are retried after `interval` seconds. The shared AI HTTP client and the database engine are disposed when the loop exits.
         """
-        while True:
-            await asyncio.sleep(interval)
-            now = datetime.now()
-            for repo_id, handler in handlers.items():
-                # Check inactivity
-                delta = now - handler.last_modified
-                if (
-                    delta.total_seconds() > inactivity_limit
-                    and not handler.is_frozen
-                ):
+        # (deadline, repo_id): the earliest deadline is always heap[0]
+        deadlines = [
+            (handler.last_modified + inactivity_limit, repo_id)
+            for repo_id, handler in handlers.items()
+        ]
+        heapq.heapify(deadlines)
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+
+        def reactivate(repo_id: str) -> None:
+            handler = handlers[repo_id]
+            heapq.heappush(
+                deadlines, (handler.last_modified + inactivity_limit, repo_id)
+            )
+            wake.set()
+
+        for repo_id, handler in handlers.items():
+            handler.on_unfreeze = (
+                lambda rid=repo_id: loop.call_soon_threadsafe(reactivate, rid)
+            )
+        try:
+            while True:
+                if deadlines:
+                    wait: Optional[float] = max(
+                        0.0, deadlines[0][0] - time.monotonic()
+                    )
+                else:
+                    wait = None
+                await _wait_for_activity(wake, wait)
+                now = time.monotonic()
+                due = []
+                while deadlines and deadlines[0][0] <= now:
+                    _deadline, repo_id = heapq.heappop(deadlines)
+                    handler = handlers[repo_id]
+                    if handler.is_frozen or repo_id in due:
+                        # Frozen repos return via on_unfreeze
+                        continue
+                    idle_seconds = now - handler.last_modified
+                    if idle_seconds < inactivity_limit:
+                        # Activity since this entry was pushed
+                        heapq.heappush(
+                            deadlines,
+                            (
+                                handler.last_modified + inactivity_limit,
+                                repo_id,
+                            ),
+                        )
+                        continue
                     console.print(
-                        f"[blue]Inactivity detected in {repo_id} ({delta}). "
-                        "Freezing...[/blue]"
+                        f"[blue]Inactivity detected in {repo_id} "
+                        f"({idle_seconds:.0f}s idle). Freezing...[/blue]"
                     )
-                    try:
-                        await run_freeze(repo_id, cfg)
-                        handler.is_frozen = True
+                    due.append(repo_id)
+                if not due:
+                    continue
+                # Freeze every stale repository together so their git,
+                # terminal and AI round-trips overlap.
+                results = await asyncio.gather(
+                    *(run_freeze(repo_id, cfg) for repo_id in due),
+                    return_exceptions=True,
+                )
+                for repo_id, result in zip(due, results):
+                    if isinstance(result, (OSError, ValueError)):
                         console.print(
-                            f"[green]Repository {repo_id} is now "
-                            "FROZEN.[/green]"
+                            f"[red]Error freezing {repo_id}: {result}[/red]"
                         )
-                    except (OSError, ValueError) as e:
+                        heapq.heappush(deadlines, (now + interval, repo_id))
+                    elif isinstance(result, BaseException):
+                        raise result
+                    else:
+                        handlers[repo_id].is_frozen = True
                         console.print(
-                            f"[red]Error freezing {repo_id}: {e}[/red]"
+                            f"[green]Repository {repo_id} is now "
+                            "FROZEN.[/green]"
                         )
+        finally:
+            # One engine and one HTTP client serve every freeze; release
+            # them on shutdown.
+            await dispose_http_client()
+            await dispose_engine()
 
     try:
-        asyncio.run(daemon_loop())
+        run_async(daemon_loop())
     except KeyboardInterrupt:
         observer.stop()
     finally:
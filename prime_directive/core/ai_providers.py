@@ -1,10 +1,89 @@
 import asyncio
+import functools
+import importlib.util
 import os
+import random
+import time
 from datetime import datetime, timezone
-from typing import Optional, Tuple, TypedDict
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    cast,
+)
 
 import httpx
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
+
+from prime_directive.core.db import AIUsageLog, get_session, init_db
+from prime_directive.core.json_utils import (
+    JSON_HEADERS,
+    json_dumps,
+    json_loads,
+)
+
+# Shared async client (and the loop it belongs to) so AI calls reuse pooled
+# keep-alive connections and TLS sessions instead of rebuilding them per call.
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+# HTTP/2 needs the optional `h2` package (the "fast" extra); with it, TLS
+# endpoints such as OpenAI multiplex concurrent calls over one connection.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+# Usage rows waiting for their commit, per database. Callers that log while a
+# batch is still open join it and share one transaction.
+_usage_batches: Dict[str, "_UsageBatch"] = {}
+
+# db_path -> (monotonic fetch time, month start, openai cost, openai calls)
+_monthly_usage_cache: Dict[str, Tuple[float, datetime, float, int]] = {}
+_MONTHLY_USAGE_TTL_SECONDS = 60.0
+
+
+class _UsageBatch:
+    """Usage rows committed together, and the future their callers await."""
+
+    __slots__ = ("rows", "done", "writer")
+
+    def __init__(self) -> None:
+        self.rows: List[Any] = []
+        self.done: "asyncio.Future[None]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.writer: Optional["asyncio.Task[None]"] = None
+
+
+async def _write_usage_batch(db_path: str, batch: _UsageBatch) -> None:
+    """
+    Commit every row of `batch` in one transaction and resolve `batch.done`.
+
+    The writer yields once before closing the batch so that callers scheduled in the same event loop iteration (e.g. concurrent freezes) can add their rows to it.
+
+    Parameters:
+        db_path (str): Database the rows are written to.
+        batch (_UsageBatch): The open batch for `db_path`.
+    """
+    try:
+        await asyncio.sleep(0)
+        if _usage_batches.get(db_path) is batch:
+            del _usage_batches[db_path]
+        await init_db(db_path)
+        async for session in get_session(db_path):
+            session.add_all(batch.rows)
+            await session.commit()
+            break
+    except asyncio.CancelledError:
+        batch.done.cancel()
+        raise
+    except Exception as exc:
+        batch.done.set_exception(exc)
+    else:
+        batch.done.set_result(None)
 
 
 async def log_ai_usage(
@@ -20,6 +99,8 @@ async def log_ai_usage(
     """
     Persist an AI usage record to the database for tracking and budget enforcement.
 
+    Records logged concurrently on the same event loop are group-committed: they share one session and one transaction, and every caller returns once that commit has finished. Every "openai" record, successful or not, is also added to the cached month-to-date totals used by `get_monthly_usage`, matching its SQL aggregate.
+
     Parameters:
         db_path (str): Filesystem path or connection string for the database to initialize and use.
         provider (str): Name of the AI provider (e.g., "openai", "ollama").
@@ -30,61 +111,187 @@ async def log_ai_usage(
         success (bool): Whether the request completed successfully.
         repo_id (Optional[str]): Optional repository identifier associated with the usage record.
     """
-    from prime_directive.core.db import AIUsageLog, get_session, init_db
+    usage = AIUsageLog(
+        provider=provider,
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cost_estimate_usd=cost_estimate_usd,
+        success=success,
+        repo_id=repo_id,
+    )
+    batch = _usage_batches.get(db_path)
+    if (
+        batch is None
+        or batch.done.get_loop() is not asyncio.get_running_loop()
+    ):
+        batch = _UsageBatch()
+        _usage_batches[db_path] = batch
+        batch.writer = asyncio.ensure_future(
+            _write_usage_batch(db_path, batch)
+        )
+    batch.rows.append(usage)
+    # Shielded so one cancelled caller does not abort the shared commit
+    await asyncio.shield(batch.done)
+
+    cached = _monthly_usage_cache.get(db_path)
+    if (
+        provider == "openai"
+        and cached is not None
+        and cached[1] == current_month_start()
+    ):
+        fetched_at, month_start, total_cost, call_count = cached
+        _monthly_usage_cache[db_path] = (
+            fetched_at,
+            month_start,
+            total_cost + cost_estimate_usd,
+            call_count + 1,
+        )
 
-    await init_db(db_path)
-    async for session in get_session(db_path):
-        usage = AIUsageLog(
-            provider=provider,
-            model=model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_estimate_usd=cost_estimate_usd,
-            success=success,
-            repo_id=repo_id,
+
+def clear_usage_cache() -> None:
+    """
+    Forget every cached month-to-date usage total.
+    """
+    _monthly_usage_cache.clear()
+
+
+# ((year, month), first instant of that month in UTC)
+_month_start_cache: Optional[Tuple[Tuple[int, int], datetime]] = None
+
+
+def current_month_start(now: Optional[datetime] = None) -> datetime:
+    """
+    Return midnight UTC on the first day of the current month.
+
+    The value is cached and only recomputed when the month rolls over.
+
+    Parameters:
+        now (Optional[datetime]): Reference time in UTC; defaults to the current time.
+
+    Returns:
+        datetime: Timezone-aware start of the month containing `now`.
+    """
+    global _month_start_cache
+    if now is None:
+        now = datetime.now(timezone.utc)
+    key = (now.year, now.month)
+    if _month_start_cache is None or _month_start_cache[0] != key:
+        month_start = now.replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
         )
-        session.add(usage)
-        await session.commit()
-        break
+        _month_start_cache = (key, month_start)
+    return _month_start_cache[1]
+
+
+# Usage queries are built once; callers bind the month start (and limit).
+_TS_COL = cast(Any, AIUsageLog.timestamp)
+_PROVIDER_COL = cast(Any, AIUsageLog.provider)
+_COST_COL = cast(Any, AIUsageLog.cost_estimate_usd)
+_OPENAI_THIS_MONTH = (
+    _TS_COL >= bindparam("month_start"),
+    _PROVIDER_COL == "openai",  # Only track paid provider
+)
+_MONTHLY_USAGE_STMT = select(
+    func.coalesce(func.sum(_COST_COL), 0.0),
+    func.count(1),
+).where(*_OPENAI_THIS_MONTH)
+_USAGE_REPORT_STMT = (
+    select(
+        AIUsageLog,
+        select(func.coalesce(func.sum(_COST_COL), 0.0))
+        .where(*_OPENAI_THIS_MONTH)
+        .correlate(None)
+        .scalar_subquery(),
+        select(func.count(1))
+        .where(*_OPENAI_THIS_MONTH)
+        .correlate(None)
+        .scalar_subquery(),
+    )
+    .where(_TS_COL >= bindparam("month_start"))
+    .order_by(_TS_COL.desc())
+    .limit(bindparam("limit"))
+)
 
 
 async def get_monthly_usage(db_path: str) -> Tuple[float, int]:
     """
     Compute the total estimated cost and number of calls for the paid provider "openai" since the start of the current month (UTC).
 
+    The totals are cached per database for `_MONTHLY_USAGE_TTL_SECONDS` and kept current by `log_ai_usage`, so the query only re-runs once the cache expires (picking up usage logged by other processes) or the month rolls over.
+
     Returns:
         (total_cost_usd, call_count): total estimated cost in USD as a float and the number of recorded calls as an int for provider "openai" from the beginning of the current month (UTC).
     """
-    from typing import Any, cast
-
-    from prime_directive.core.db import AIUsageLog, get_session, init_db
+    month_start = current_month_start()
+    cached = _monthly_usage_cache.get(db_path)
+    if (
+        cached is not None
+        and cached[1] == month_start
+        and time.monotonic() - cached[0] < _MONTHLY_USAGE_TTL_SECONDS
+    ):
+        return cached[2], cached[3]
 
     await init_db(db_path)
 
-    # Get first day of current month
-    now = datetime.now(timezone.utc)
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
     async for session in get_session(db_path):
-        ts_col = cast(Any, AIUsageLog.timestamp)
-        provider_col = cast(Any, AIUsageLog.provider)
-        cost_col = cast(Any, AIUsageLog.cost_estimate_usd)
-
-        stmt = (
-            select(
-                func.coalesce(func.sum(cost_col), 0.0),
-                func.count(1),
-            )
-            .where(ts_col >= month_start)
-            .where(provider_col == "openai")  # Only track paid provider
+        result = await session.execute(
+            _MONTHLY_USAGE_STMT, {"month_start": month_start}
         )
-        result = await session.execute(stmt)
         row = result.one()
-        return float(row[0]), int(row[1])
+        total_cost, call_count = float(row[0]), int(row[1])
+        _monthly_usage_cache[db_path] = (
+            time.monotonic(),
+            month_start,
+            total_cost,
+            call_count,
+        )
+        return total_cost, call_count
 
     return 0.0, 0
 
 
+async def get_usage_report(
+    db_path: str,
+    limit: int = 10,
+) -> Tuple[float, int, List[Any]]:
+    """
+    Fetch month-to-date OpenAI totals and the most recent usage records in a single query.
+
+    The totals are computed by uncorrelated scalar subqueries attached to each
+    of the recent rows, so the report costs one round-trip and one session.
+
+    Parameters:
+        db_path (str): Filesystem path to the database containing AI usage logs.
+        limit (int): Maximum number of recent records to return.
+
+    Returns:
+        Tuple[float, int, List[AIUsageLog]]: A tuple containing:
+            - The month's total estimated OpenAI cost in USD.
+            - The month's number of OpenAI calls.
+            - This month's records for any provider, ordered newest first.
+    """
+    await init_db(db_path)
+
+    month_start = current_month_start()
+
+    async for session in get_session(db_path):
+        result = await session.execute(
+            _USAGE_REPORT_STMT, {"month_start": month_start, "limit": limit}
+        )
+        rows = result.all()
+        if not rows:
+            # No usage at all this month, so no OpenAI usage either.
+            return 0.0, 0, []
+        return (
+            float(rows[0][1]),
+            int(rows[0][2]),
+            [row[0] for row in rows],
+        )
+
+    return 0.0, 0, []
+
+
 async def check_budget(
     db_path: str,
     monthly_budget_usd: float,
@@ -110,6 +317,45 @@ async def check_budget(
     )
 
 
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient for the running event loop, creating it on first use.
+
+    Connections are bound to the loop that opened them, so a new client is created whenever the running loop differs from the one the current client was created on. Requests must pass their own `timeout`; the client has no default. HTTP/2 is enabled when `h2` is installed; plain-HTTP endpoints such as a local Ollama keep using HTTP/1.1.
+
+    Returns:
+        httpx.AsyncClient: Client shared by the AI provider calls in this module.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if (
+        _http_client is None
+        or _http_client.is_closed
+        or _http_client_loop is not loop
+    ):
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(None),
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=64
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def dispose_http_client() -> None:
+    """
+    Close the shared AI HTTP client, if one was created on the running loop.
+    """
+    global _http_client, _http_client_loop
+    client, loop = _http_client, _http_client_loop
+    _http_client = None
+    _http_client_loop = None
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
 def estimate_cost(output_tokens: int, cost_per_1k: float = 0.002) -> float:
     """
     Estimate cost from output token count using a per-1k-token rate.
@@ -124,6 +370,57 @@ def estimate_cost(output_tokens: int, cost_per_1k: float = 0.002) -> float:
     return (output_tokens / 1000) * cost_per_1k
 
 
+# Default upper bound for a single retry delay in generate_ollama.
+_RETRY_BACKOFF_CAP_SECONDS = 30.0
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read the delay a 429 or 503 response asked the client to wait.
+
+    Parameters:
+        error (Exception): The error raised by the attempt.
+
+    Returns:
+        Optional[float]: Seconds to wait (never negative) when `error` is an HTTP status error whose response carries a `Retry-After` header given as delta-seconds or an HTTP-date; None when there is no usable header.
+    """
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    value = error.response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Decide whether a failed Ollama request is worth retrying.
+
+    Parameters:
+        error (Exception): The error raised by the attempt.
+
+    Returns:
+        bool: True for transport failures (connect errors, timeouts, dropped connections) and for 429 or 5xx responses; False for other statuses and for malformed payloads, which would fail the same way again.
+    """
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
 async def generate_ollama(
     *,
     api_url: str,
@@ -133,6 +430,7 @@ async def generate_ollama(
     timeout_seconds: float,
     max_retries: int = 0,
     backoff_seconds: float = 0.0,
+    max_backoff_seconds: float = _RETRY_BACKOFF_CAP_SECONDS,
 ) -> str:
     """
     Request a completion from an Ollama HTTP API and return the generated text.
@@ -143,15 +441,16 @@ async def generate_ollama(
         prompt (str): User prompt to send to the model.
         system (str): System/instructional context to include with the prompt.
         timeout_seconds (float): Request timeout in seconds for each attempt.
-        max_retries (int): Number of retry attempts to perform on failure (default 0).
-        backoff_seconds (float): Base backoff seconds for exponential backoff between retries (default 0.0).
+        max_retries (int): Number of retry attempts to perform on transient failures (default 0).
+        backoff_seconds (float): Minimum delay between retries; each delay is drawn at random between this and three times the previous one (default 0.0). A `Retry-After` header on a 429/503 response takes precedence.
+        max_backoff_seconds (float): Upper bound for any single retry delay, including one requested by `Retry-After` (default `_RETRY_BACKOFF_CAP_SECONDS`).
 
     Returns:
         str: The generated response text from the Ollama API.
 
     Raises:
-        httpx.HTTPError: If the HTTP request fails and all retry attempts are exhausted.
-        ValueError: If the response payload is missing a valid `response` string.
+        httpx.HTTPError: If the HTTP request fails and all retry attempts are exhausted, or fails with a non-transient status.
+        ValueError: If the response payload is missing a valid `response` string (never retried).
     """
     payload = {
         "model": model,
@@ -162,22 +461,38 @@ async def generate_ollama(
 
     last_error: Optional[Exception] = None
     attempts = max_retries + 1
+    delay = backoff_seconds
     for attempt in range(attempts):
         try:
-            async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-                response = await client.post(api_url, json=payload)
+            response = await _get_http_client().post(
+                api_url,
+                content=json_dumps(payload),
+                headers=JSON_HEADERS,
+                timeout=timeout_seconds,
+            )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             content = data.get("response")
             if not isinstance(content, str) or not content.strip():
                 raise ValueError("No response field in Ollama payload")
             return content
         except (httpx.HTTPError, ValueError) as e:
             last_error = e
-            if attempt >= attempts - 1:
+            if attempt >= attempts - 1 or not _is_transient(e):
                 break
-            if backoff_seconds > 0:
-                await asyncio.sleep(backoff_seconds * (2**attempt))
+            retry_after = _retry_after_seconds(e)
+            if retry_after is not None:
+                # The server said when it will be ready; waiting less
+                # only earns another 429/503.
+                await asyncio.sleep(min(max_backoff_seconds, retry_after))
+            elif backoff_seconds > 0:
+                # Decorrelated jitter keeps concurrent retries from
+                # hitting the server in lockstep.
+                delay = min(
+                    max_backoff_seconds,
+                    random.uniform(backoff_seconds, delay * 3),
+                )
+                await asyncio.sleep(delay)
 
     assert last_error is not None
     raise last_error
@@ -273,10 +588,14 @@ async def generate_openai_chat_with_usage(
         "max_tokens": max_tokens,
     }
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-        response = await client.post(api_url, json=payload, headers=headers)
+    response = await _get_http_client().post(
+        api_url,
+        content=json_dumps(payload),
+        headers=headers,
+        timeout=timeout_seconds,
+    )
     response.raise_for_status()
-    data = response.json()
+    data = json_loads(response.content)
 
     choices = data.get("choices")
     if not choices:
@@ -311,10 +630,91 @@ async def generate_openai_chat_with_usage(
     return content.strip(), usage
 
 
+async def stream_openai_chat(
+    *,
+    api_url: str,
+    api_key: str,
+    model: str,
+    system: str,
+    prompt: str,
+    timeout_seconds: float,
+    max_tokens: int,
+) -> AsyncIterator[str]:
+    """
+    Stream a chat completion from an OpenAI-compatible API, yielding content deltas as they arrive.
+
+    Parameters:
+        api_url (str): Full HTTP endpoint for the chat completion API.
+        api_key (str): Bearer API key used for Authorization.
+        model (str): Model identifier to request (e.g., "gpt-4o").
+        system (str): System prompt providing high-level instructions for the assistant.
+        prompt (str): User prompt to include as the chat message.
+        timeout_seconds (float): Request timeout in seconds for the HTTP client.
+        max_tokens (int): Maximum number of tokens the model is allowed to generate for the completion.
+
+    Returns:
+        AsyncIterator[str]: Non-empty content fragments in the order the server sends them.
+
+    Raises:
+        httpx.HTTPStatusError: If the HTTP request returns a non-success status.
+        ValueError: If a server-sent event cannot be decoded or the stream produced no content.
+    """
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+    payload = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt},
+        ],
+        "max_tokens": max_tokens,
+        "stream": True,
+    }
+
+    produced = False
+    async with _get_http_client().stream(
+        "POST",
+        api_url,
+        content=json_dumps(payload),
+        headers=headers,
+        timeout=timeout_seconds,
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+            try:
+                event = json_loads(data)
+            except ValueError as e:
+                raise ValueError("Malformed event in AI stream") from e
+
+            choices = event.get("choices") if isinstance(event, dict) else None
+            if not choices or not isinstance(choices[0], dict):
+                continue
+            delta = choices[0].get("delta")
+            content = delta.get("content") if isinstance(delta, dict) else None
+            if isinstance(content, str) and content:
+                produced = True
+                yield content
+
+    if not produced:
+        raise ValueError("No content in AI response")
+
+
+@functools.cache
 def get_openai_api_key(env_var: str = "OPENAI_API_KEY") -> Optional[str]:
     """
     Retrieve the OpenAI API key from an environment variable.
 
+    The value is read once per process and memoized; call
+    `get_openai_api_key.cache_clear()` after changing the environment.
+
     Parameters:
         env_var (str): Name of the environment variable to read (default "OPENAI_API_KEY").
 
@@ -1,3 +1,4 @@
+import functools
 import importlib.util
 import logging
 import subprocess
@@ -14,8 +15,17 @@ ALLOWLIST = {
     "tiktoken",
     "requests",
     "httpx",
+    "orjson",
 }
 
+# Skip pip's self-update check (a network round-trip) and never prompt; prefer
+# wheels so an allowlisted package is not built from source when avoidable.
+_PIP_INSTALL_FLAGS = (
+    "--disable-pip-version-check",
+    "--no-input",
+    "--prefer-binary",
+)
+
 
 def is_venv() -> bool:
     """
@@ -27,6 +37,22 @@ def is_venv() -> bool:
     return sys.prefix != sys.base_prefix
 
 
+@functools.lru_cache(maxsize=256)
+def _spec_exists(pkg: str) -> bool:
+    """
+    Report whether `pkg` is importable, remembering the answer per process.
+
+    `find_spec` walks `sys.path` and stats the filesystem, so repeated checks of the same package are served from the cache. Call `_spec_exists.cache_clear()` after installing packages.
+
+    Parameters:
+        pkg (str): Top-level package name.
+
+    Returns:
+        bool: `True` if an import spec for `pkg` exists, `False` otherwise.
+    """
+    return importlib.util.find_spec(pkg) is not None
+
+
 def ensure_packages(packages: List[str], auto_install: bool = False) -> None:
     """
     Ensure the listed Python packages are available, optionally installing missing allowlisted packages when running inside a virtual environment.
@@ -39,7 +65,7 @@ def ensure_packages(packages: List[str], auto_install: bool = False) -> None:
     """
     missing = []
     for pkg in packages:
-        if not importlib.util.find_spec(pkg):
+        if not _spec_exists(pkg):
             missing.append(pkg)
 
     if not missing:
@@ -76,8 +102,10 @@ def ensure_packages(packages: List[str], auto_install: bool = False) -> None:
     )
     try:
         subprocess.check_call(
-            [sys.executable, "-m", "pip", "install"] + to_install
+            [sys.executable, "-m", "pip", "install", *_PIP_INSTALL_FLAGS]
+            + to_install
         )
         logger.info("Successfully installed packages.")
+        _spec_exists.cache_clear()
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to auto-install packages: {e}")
@@ -4,7 +4,7 @@ from typing import Dict, Optional
 from hydra.core.config_store import ConfigStore
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemConfig:
     editor_cmd: str = "windsurf"
     editor_args: list[str] = field(default_factory=lambda: ["-n"])
@@ -21,6 +21,8 @@ class SystemConfig:
     ollama_timeout_seconds: float = 5.0
     ollama_max_retries: int = 2
     ollama_backoff_seconds: float = 0.5
+    ollama_max_backoff_seconds: float = 30.0
+    # Cap for one Ollama retry delay, including server Retry-After
     ai_monthly_budget_usd: float = 10.0
     # Monthly budget for paid AI providers
     ai_cost_per_1k_tokens: float = 0.002
@@ -33,7 +35,7 @@ class SystemConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoConfig:
     id: str
     path: str
@@ -41,7 +43,7 @@ class RepoConfig:
     active_branch: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimeConfig:
     system: SystemConfig = field(default_factory=SystemConfig)
     repos: Dict[str, RepoConfig] = field(default_factory=dict)
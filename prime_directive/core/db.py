@@ -1,3 +1,4 @@
+import asyncio
 import os
 import threading
 from datetime import datetime, timezone
@@ -76,11 +77,45 @@ class AIUsageLog(SQLModel, table=True):  # type: ignore[call-arg]
     success: bool = Field(default=True)
     repo_id: Optional[str] = Field(default=None)
 
+    __table_args__ = (
+        # Covers the month-to-date budget aggregate, so SUM/COUNT read only
+        # this month's index entries for one provider.
+        Index(
+            "ix_aiusagelog_provider_timestamp_cost",
+            "provider",
+            "timestamp",
+            "cost_estimate_usd",
+        ),
+    )
+
 
 # Database Connection
 # We will use a function to initialize the engine to allow for configuration
 _engine_lock = threading.Lock()
 _async_engines: Dict[str, AsyncEngine] = {}
+# Session factory per cached engine, keyed like _async_engines
+_session_factories: Dict[str, async_sessionmaker[AsyncSession]] = {}
+# Expanded DB paths whose schema has been created/migrated by this process
+_initialized_dbs: set[str] = set()
+# Expanded DB paths with a migration in progress, so concurrent callers share it
+_init_tasks: Dict[str, "asyncio.Future[None]"] = {}
+# Parent directories already created by get_engine; kept across disposals so
+# rebuilding an engine for the same path skips the makedirs stat walk
+_ensured_dirs: set[str] = set()
+
+
+# Applied to every new connection. WAL lets readers run alongside the writer;
+# with WAL, synchronous=NORMAL only fsyncs at checkpoints and cannot corrupt
+# the database. The cache, temp store and mmap settings keep hot pages and
+# sort scratch space in memory.
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
 
 
 def get_engine(db_path: str = "~/.prime-directive/data/prime.db"):
@@ -100,8 +135,11 @@ def get_engine(db_path: str = "~/.prime-directive/data/prime.db"):
 
     Notes:
         If `db_path` is not ":memory:", the function ensures the parent directory
-        exists before creating the engine. On each new DB-API connection the engine
-        sets `PRAGMA foreign_keys=ON` and `PRAGMA journal_mode=WAL`.
+        exists before creating the engine; each directory is created at most
+        once per process, so later engines for it skip the check. On each new DB-API connection the engine
+        applies `_SQLITE_PRAGMAS`: foreign keys, WAL journaling with
+        `synchronous=NORMAL`, a 20 MB page cache, in-memory temp storage and
+        memory-mapped reads.
     """
     db_path = os.path.expanduser(db_path)
 
@@ -114,11 +152,12 @@ def get_engine(db_path: str = "~/.prime-directive/data/prime.db"):
         if engine is not None:
             return engine
 
-        # Ensure directory exists
+        # Ensure directory exists (once per directory per process)
         if db_path != ":memory:":
             dir_name = os.path.dirname(db_path)
-            if dir_name:
+            if dir_name and dir_name not in _ensured_dirs:
                 os.makedirs(dir_name, exist_ok=True)
+                _ensured_dirs.add(dir_name)
 
         database_url = f"sqlite+aiosqlite:///{db_path}"
 
@@ -131,13 +170,14 @@ def get_engine(db_path: str = "~/.prime-directive/data/prime.db"):
         @event.listens_for(engine.sync_engine, "connect")
         def _set_sqlite_pragma(dbapi_connection, _connection_record):
             """
-            Set SQLite pragmas on a newly opened DB-API connection to enable foreign key enforcement and WAL journaling.
+            Set SQLite pragmas on a newly opened DB-API connection to enable foreign key enforcement, WAL journaling and the performance settings.
 
-            This function executes PRAGMA statements on the given DB-API
-            connection: it enables foreign key constraints ('PRAGMA
-            foreign_keys=ON') and sets the journal mode to write-ahead logging
-            ('PRAGMA journal_mode=WAL'). It is intended to be used as a
-            SQLAlchemy connect event listener.
+            This function executes each statement in `_SQLITE_PRAGMAS` on the
+            given DB-API connection: it enables foreign key constraints, sets
+            the journal mode to write-ahead logging with
+            'synchronous=NORMAL', and sizes the page cache, temp store and
+            mmap window. It is intended to be used as a SQLAlchemy connect
+            event listener.
 
             Parameters:
                 dbapi_connection: The raw DB-API connection object provided
@@ -146,30 +186,83 @@ def get_engine(db_path: str = "~/.prime-directive/data/prime.db"):
                     (unused).
             """
             cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.execute("PRAGMA journal_mode=WAL")
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
             cursor.close()
 
         _async_engines[db_path] = engine
+        _session_factories[db_path] = async_sessionmaker(
+            engine, expire_on_commit=False
+        )
         return engine
 
 
+def get_session_factory(
+    db_path: str = "~/.prime-directive/data/prime.db",
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Return the session factory bound to the cached engine for `db_path`, creating both on first use.
+
+    Parameters:
+        db_path (str): Filesystem path for the SQLite database; expanded like `get_engine`.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: Factory producing sessions with `expire_on_commit=False`.
+    """
+    key = os.path.expanduser(db_path)
+    factory = _session_factories.get(key)
+    while factory is None:
+        # get_engine registers the engine and its factory together under
+        # _engine_lock; re-read in case a concurrent dispose_engine dropped
+        # them before we looked, so no factory outlives its engine.
+        get_engine(db_path)
+        factory = _session_factories.get(key)
+    return factory
+
+
 async def init_db(db_path: str = "data/prime.db") -> None:
     """
     Initialize the database and apply schema migrations up to the current version.
 
+    Only the first call per database in a process does any work; later calls return immediately until the engine is disposed. Calls that arrive while a migration is running on the same event loop wait for it instead of starting another.
+
     Parameters:
         db_path (str): Filesystem path to the SQLite database file (defaults to "data/prime.db").
     """
-    await migrate_db(db_path)
+    key = os.path.expanduser(db_path)
+    if key in _initialized_dbs:
+        return
+    pending = _init_tasks.get(key)
+    if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+        pending = asyncio.ensure_future(migrate_db(db_path))
+        _init_tasks[key] = pending
+    try:
+        # Shielded so one cancelled caller does not abort the shared work
+        await asyncio.shield(pending)
+    finally:
+        if pending.done() and _init_tasks.get(key) is pending:
+            del _init_tasks[key]
+    _initialized_dbs.add(key)
 
 
 # Schema version history:
 #   0 → 1: initial schema (Repository, ContextSnapshot, EventLog, AIUsageLog)
-_CURRENT_SCHEMA_VERSION = 1
+#   1 → 2: (repo_id, timestamp) index on contextsnapshot for existing DBs
+#   2 → 3: covering (provider, timestamp, cost) index on aiusagelog
+_CURRENT_SCHEMA_VERSION = 3
 
 _MIGRATIONS: dict[int, list[str]] = {
     1: [],  # baseline — tables created by create_all; no ALTER statements needed
+    # create_all() skips indexes of tables that already exist, so databases
+    # created before the index was declared never received it.
+    2: [
+        "CREATE INDEX IF NOT EXISTS ix_contextsnapshot_repo_id_timestamp "
+        "ON contextsnapshot (repo_id, timestamp)",
+    ],
+    3: [
+        "CREATE INDEX IF NOT EXISTS ix_aiusagelog_provider_timestamp_cost "
+        "ON aiusagelog (provider, timestamp, cost_estimate_usd)",
+    ],
 }
 
 
@@ -245,18 +338,20 @@ async def get_session(
     Returns:
         AsyncSession: An open AsyncSession instance bound to the database; the session is closed when the generator exits.
     """
-    engine = get_engine(db_path)
-    async_session = async_sessionmaker(engine, expire_on_commit=False)
-    async with async_session() as session:
+    async with get_session_factory(db_path)() as session:
         yield session
 
 
 async def dispose_engine(db_path: Optional[str] = None):
     """Dispose cached async engine(s) to ensure clean exit."""
-    global _async_engines
+    global _async_engines, _session_factories
     if db_path is not None:
+        db_path = os.path.expanduser(db_path)
         with _engine_lock:
             engine = _async_engines.pop(db_path, None)
+            _session_factories.pop(db_path, None)
+            # A disposed in-memory database is gone; re-run init next time.
+            _initialized_dbs.discard(db_path)
         if engine is not None:
             await engine.dispose()
         return
@@ -264,5 +359,7 @@ async def dispose_engine(db_path: Optional[str] = None):
     with _engine_lock:
         engines = list(_async_engines.values())
         _async_engines = {}
+        _session_factories = {}
+        _initialized_dbs.clear()
     for engine in engines:
         await engine.dispose()
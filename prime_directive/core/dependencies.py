@@ -1,10 +1,21 @@
-import os
+import functools
 import platform
 import shutil
 from dataclasses import dataclass
-from typing import Optional
+from typing import FrozenSet, Optional, Tuple
 
-import requests
+import httpx
+
+from prime_directive.core.ai_providers import get_openai_api_key
+from prime_directive.core.json_utils import json_loads
+
+# Shared client so repeated probes (doctor, daemon) reuse one connection pool
+# instead of opening a fresh socket per request.
+_http_client: Optional[httpx.Client] = None
+
+# Connecting to a local server takes well under a millisecond; a probe that
+# cannot connect quickly should fail fast instead of stalling the command.
+_OLLAMA_CONNECT_TIMEOUT_SECONDS = 0.25
 
 
 @dataclass(frozen=True)
@@ -27,19 +38,94 @@ def get_ollama_install_cmd() -> str:
     return "See https://ollama.com/download"
 
 
+def _get_http_client() -> httpx.Client:
+    """
+    Return the module-level HTTP client, creating it on first use.
+
+    Returns:
+        httpx.Client: Client shared by the dependency probes in this module.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.Client(timeout=2.0)
+    return _http_client
+
+
+def close_http_client() -> None:
+    """
+    Close the shared HTTP client, if one was created.
+    """
+    global _http_client
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+
+
+@functools.cache
+def _ollama_path() -> Optional[str]:
+    """
+    Resolve the `ollama` executable on PATH once per process.
+
+    Returns:
+        Optional[str]: Absolute path of the `ollama` binary, or None if it is not on PATH. Call `_ollama_path.cache_clear()` after installing Ollama to look again.
+    """
+    return shutil.which("ollama")
+
+
 def is_ollama_installed() -> bool:
-    return shutil.which("ollama") is not None
+    return _ollama_path() is not None
+
+
+def _probe_ollama_tags(
+    api_tags_url: str, timeout_seconds: float
+) -> Tuple[bool, Optional[FrozenSet[str]]]:
+    """
+    Answer both "is Ollama running?" and "which models are pulled?" from a single `/api/tags` response.
+
+    Parameters:
+        api_tags_url (str): Full URL of the Ollama `/api/tags` endpoint.
+        timeout_seconds (float): Request timeout in seconds; connecting is further capped at `_OLLAMA_CONNECT_TIMEOUT_SECONDS`.
+
+    Returns:
+        Tuple[bool, Optional[FrozenSet[str]]]: Whether the server answered with HTTP 200, and its model names, or None when the server is down or the payload could not be parsed.
+    """
+    try:
+        resp = _get_http_client().get(
+            api_tags_url,
+            timeout=httpx.Timeout(
+                timeout_seconds,
+                connect=min(timeout_seconds, _OLLAMA_CONNECT_TIMEOUT_SECONDS),
+            ),
+        )
+    except httpx.HTTPError:
+        return False, None
+    if resp.status_code != 200:
+        return False, None
+    try:
+        # Raw bytes through orjson when available, skipping charset detection
+        models = json_loads(resp.content).get("models", [])
+        return True, frozenset(
+            m.get("name", "") for m in models if isinstance(m, dict)
+        )
+    except (ValueError, KeyError):
+        return True, None
+
+
+def _has_model(model_names: FrozenSet[str], model_name: str) -> bool:
+    # Exact names and the usual ":latest" tag are set lookups; only other
+    # tags of the same model need the prefix scan.
+    if model_name in model_names or f"{model_name}:latest" in model_names:
+        return True
+    prefix = f"{model_name}:"
+    return any(name.startswith(prefix) for name in model_names)
 
 
 def check_ollama_running(
     api_tags_url: str = "http://localhost:11434/api/tags",
     timeout_seconds: float = 2.0,
 ) -> bool:
-    try:
-        resp = requests.get(api_tags_url, timeout=timeout_seconds)
-        return resp.status_code == 200
-    except requests.exceptions.RequestException:
-        return False
+    running, _model_names = _probe_ollama_tags(api_tags_url, timeout_seconds)
+    return running
 
 
 def check_ollama_model_present(
@@ -47,22 +133,8 @@ def check_ollama_model_present(
     api_tags_url: str = "http://localhost:11434/api/tags",
     timeout_seconds: float = 2.0,
 ) -> bool:
-    try:
-        resp = requests.get(api_tags_url, timeout=timeout_seconds)
-        if resp.status_code != 200:
-            return False
-        models = resp.json().get("models", [])
-        model_names = [
-            m.get("name", "") for m in models if isinstance(m, dict)
-        ]
-        return any(
-            name == model_name or name.startswith(f"{model_name}:")
-            for name in model_names
-        )
-    except requests.exceptions.RequestException:
-        return False
-    except (ValueError, KeyError):
-        return False
+    _running, model_names = _probe_ollama_tags(api_tags_url, timeout_seconds)
+    return model_names is not None and _has_model(model_names, model_name)
 
 
 def get_ollama_status(
@@ -72,9 +144,11 @@ def get_ollama_status(
     tags_url = f"{api_base}/api/tags"
     installed = is_ollama_installed()
     running = False
+    model_names: Optional[FrozenSet[str]] = None
 
     if installed:
-        running = check_ollama_running(tags_url)
+        # One /api/tags response answers both the running and model checks
+        running, model_names = _probe_ollama_tags(tags_url, 2.0)
 
     install_cmd = get_ollama_install_cmd()
     start_cmd = "ollama serve &"
@@ -102,7 +176,7 @@ def get_ollama_status(
             check_cmd=check_cmd,
         )
 
-    if not check_ollama_model_present(model_name, tags_url):
+    if model_names is None or not _has_model(model_names, model_name):
         return DependencyStatus(
             name="Ollama",
             installed=True,
@@ -128,5 +202,5 @@ def get_ollama_status(
 
 
 def has_openai_api_key(env_var: str = "OPENAI_API_KEY") -> bool:
-    value = os.getenv(env_var)
-    return bool(value)
+    # Shares the memoized lookup used by the AI providers.
+    return get_openai_api_key(env_var) is not None
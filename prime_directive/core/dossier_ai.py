@@ -207,6 +207,7 @@ async def generate_theme_suggestions_with_ai(
     cost_per_1k_tokens: float,
     limit: int = 5,
     max_prompt_chars: int = 12000,
+    max_backoff_seconds: float = 30.0,
 ) -> tuple[list[ThemeSuggestion], Optional[AIAnalysisMetadata], Optional[str]]:
     """
     Generate a list of recurring technical theme suggestions from provided snapshot texts using an AI provider.
@@ -233,6 +234,7 @@ async def generate_theme_suggestions_with_ai(
         cost_per_1k_tokens (float): Cost per 1k output tokens used to estimate OpenAI cost.
         limit (int): Maximum number of theme suggestions to return (default 5).
         max_prompt_chars (int): Maximum combined character length of snapshots included in the prompt (default 12000).
+        max_backoff_seconds (float): Upper bound for a single retry delay of the primary provider, including one requested by `Retry-After` (default 30.0).
 
     Returns:
         tuple[list[ThemeSuggestion], Optional[AIAnalysisMetadata], Optional[str]]:
@@ -426,6 +428,7 @@ async def generate_theme_suggestions_with_ai(
             timeout_seconds=timeout_seconds,
             max_retries=max_retries,
             backoff_seconds=backoff_seconds,
+            max_backoff_seconds=max_backoff_seconds,
         )
         return await finalize_success(response_text, "ollama", model, None)
     except (
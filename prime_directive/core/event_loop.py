@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # Optional: installed via the "fast" extra
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Return the event loop factory used by the CLI entry points.
+
+    Returns:
+        Optional[Callable[[], asyncio.AbstractEventLoop]]: `uvloop.new_event_loop` when uvloop is installed, otherwise None so asyncio picks its default loop.
+    """
+    if uvloop is None:
+        return None
+    return uvloop.new_event_loop
+
+
+def event_runner() -> asyncio.Runner:
+    """
+    Create an `asyncio.Runner` whose loop comes from `loop_factory()`.
+
+    Use it as a context manager when a command needs several `runner.run(...)` calls, so they share one event loop instead of building and tearing down one per call.
+
+    Returns:
+        asyncio.Runner: An unstarted runner; its loop is created on first use and closed when the context exits.
+    """
+    return asyncio.Runner(loop_factory=loop_factory())
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a fresh event loop, preferring uvloop when available.
+
+    This is a drop-in replacement for `asyncio.run` that does not touch the global event loop policy.
+
+    Parameters:
+        coro (Coroutine): The coroutine to execute.
+
+    Returns:
+        T: The coroutine's result.
+    """
+    with event_runner() as runner:
+        return runner.run(coro)
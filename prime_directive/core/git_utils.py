@@ -1,11 +1,13 @@
 import asyncio
 import os
-import re
 from asyncio.subprocess import PIPE
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union, cast
 
 GitStatus = Dict[str, Union[str, bool, List[str]]]
 
+# How long a timed-out git process gets to exit after being killed
+_KILL_GRACE_SECONDS = 0.2
+
 
 async def _run_git_command(
     repo_path: str,
@@ -31,7 +33,8 @@ async def _run_git_command(
 
     Raises:
         asyncio.TimeoutError: If the command does not complete within
-            timeout_seconds; the subprocess is killed before the exception is
+            timeout_seconds; the subprocess is killed, and given up to
+            `_KILL_GRACE_SECONDS` to exit, before the exception is
             re-raised.
     """
     proc = await asyncio.create_subprocess_exec(
@@ -46,7 +49,13 @@ async def _run_git_command(
         )
     except asyncio.TimeoutError:
         proc.kill()
-        await proc.communicate()
+        # Reap the child without draining its pipes: a process git started
+        # (a hook, fsmonitor) may have inherited them and hold them open
+        # long after git itself is gone.
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=_KILL_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            pass
         raise
 
     stdout = stdout_b.decode(errors="replace")
@@ -55,6 +64,28 @@ async def _run_git_command(
     return returncode, stdout, stderr
 
 
+def _max_mtime(repo_path: str, files: List[str]) -> float:
+    """
+    Return the newest modification time among `files`, relative to `repo_path`.
+
+    Parameters:
+        repo_path (str): Directory the file paths are relative to.
+        files (List[str]): Relative file paths to stat; paths that cannot be stat'ed are skipped.
+
+    Returns:
+        float: The largest `st_mtime` found, or 0.0 if none could be read.
+    """
+    max_mtime = 0.0
+    for f in files:
+        try:
+            mtime = os.stat(os.path.join(repo_path, f)).st_mtime
+        except OSError:
+            continue
+        if mtime > max_mtime:
+            max_mtime = mtime
+    return max_mtime
+
+
 async def get_last_touched(repo_path: str) -> Optional[float]:
     """
     Get the latest modification timestamp among tracked and untracked files in the repository, respecting .gitignore.
@@ -91,16 +122,8 @@ async def get_last_touched(repo_path: str) -> Optional[float]:
         if not files:
             return None
 
-        max_mtime = 0.0
-        for f in files:
-            full_path = os.path.join(repo_path, f)
-            try:
-                stat = os.stat(full_path)
-                if stat.st_mtime > max_mtime:
-                    max_mtime = stat.st_mtime
-            except OSError:
-                pass
-
+        # One stat per file adds up on large trees; keep it off the loop.
+        max_mtime = await asyncio.to_thread(_max_mtime, repo_path, files)
         return max_mtime if max_mtime > 0 else None
     except Exception:
         return None
@@ -129,44 +152,56 @@ async def get_status(repo_path: str) -> GitStatus:
         }
 
     try:
-        # Get current branch
-        rc, branch_out, _branch_err = await _run_git_command(
-            repo_path,
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            timeout_seconds=5,
+        # The three commands are independent, so run them concurrently: the
+        # wall time is the slowest command rather than the sum. Every
+        # command is left to finish (each is bounded by its own timeout)
+        # before the first failure, if any, is re-raised.
+        results = await asyncio.gather(
+            _run_git_command(
+                repo_path,
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+                timeout_seconds=5,
+            ),
+            _run_git_command(
+                repo_path,
+                ["git", "status", "--porcelain"],
+                timeout_seconds=5,
+            ),
+            _run_git_command(
+                repo_path,
+                ["git", "diff", "--stat"],
+                timeout_seconds=5,
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        branch_result, status_result, diff_result = cast(
+            List[Tuple[int, str, str]], results
         )
+
+        rc, branch_out, _branch_err = branch_result
         if rc == 0:
             branch = branch_out.strip()
         else:
             branch = "unknown"
 
-        # Get status (porcelain)
-        _rc, status_output, _status_err = await _run_git_command(
-            repo_path,
-            ["git", "status", "--porcelain"],
-            timeout_seconds=5,
-        )
+        _rc, status_output, _status_err = status_result
 
         # Parse porcelain output for filenames
         # Porcelain format: XY PATH (XY are status codes, space separated from
-        # path)
-        # Regex captures: (Group 1: Status XY) (Group 2: Path)
-        # Matches start of line, 2 chars for status, 1 space, then the rest is
-        # path
-        uncommitted_files = []
-        for line in status_output.splitlines():
-            match = re.match(r"^(.{2}) (.*)$", line)
-            if match:
-                uncommitted_files.append(match.group(2))
+        # path), so the path is everything after the first three characters.
+        # A slice avoids a regex match object per line on very dirty trees.
+        uncommitted_files = [
+            line[3:]
+            for line in status_output.splitlines()
+            if len(line) > 3 and line[2] == " "
+        ]
 
         is_dirty = len(uncommitted_files) > 0
 
-        # Get diff stat
-        _rc, diff_out, _diff_err = await _run_git_command(
-            repo_path,
-            ["git", "diff", "--stat"],
-            timeout_seconds=5,
-        )
+        _rc, diff_out, _diff_err = diff_result
         diff_stat = diff_out.strip()
 
         return {
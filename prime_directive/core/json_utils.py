@@ -0,0 +1,44 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional: installed via the "fast" extra
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def json_dumps(payload: Any) -> bytes:
+    """
+    Serialize a request body to compact UTF-8 JSON, using orjson when it is installed.
+
+    Parameters:
+        payload (Any): JSON-serializable request body.
+
+    Returns:
+        bytes: The encoded body.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Parameters:
+        data (Union[bytes, str]): Response body or stream line.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        ValueError: If `data` is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,41 +1,108 @@
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+from typing import Optional
 
+# Background thread that owns the log file; replaced on every setup_logging.
+_listener: Optional[logging.handlers.QueueListener] = None
 
-def setup_logging(log_file="~/.prime-directive/logs/pd.log"):
+# The log is rolled over at this size, keeping this many old files.
+_LOG_MAX_BYTES = 5_000_000
+_LOG_BACKUP_COUNT = 3
+
+
+def stop_logging() -> None:
+    """
+    Flush queued log records to disk and stop the background log writer.
+
+    Safe to call more than once; it is registered with `atexit` so records
+    logged just before the process exits are not lost.
+    """
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_logging)
+
+
+def setup_logging(
+    log_file="~/.prime-directive/logs/pd.log", rotate: bool = False
+):
     """
     Configure logging to file.
 
     Note: Console output is handled by Typer/Rich, so only file logging is
     configured here.
+
+    Log calls only enqueue the record on the root logger's QueueHandler; a
+    QueueListener thread formats it and does the file I/O, so logging from
+    async code never blocks on a write. Calling this again replaces the
+    previous writer after flushing it.
+
+    Parameters:
+        log_file (str): Log file path; `~` is expanded.
+        rotate (bool): Roll the file over at `_LOG_MAX_BYTES`, keeping
+            `_LOG_BACKUP_COUNT` old files. Only enable this for a file that
+            a single process writes: rotation renames the file under any
+            other process appending to it. Defaults to append-only.
     """
+    global _listener
     log_file = os.path.expanduser(log_file)
     log_dir = os.path.dirname(log_file)
     if log_dir:
         os.makedirs(log_dir, exist_ok=True)
 
+    stop_logging()
+
+    # delay=True: commands that log nothing never open the file.
+    file_handler: logging.FileHandler
+    if rotate:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=_LOG_MAX_BYTES,
+            backupCount=_LOG_BACKUP_COUNT,
+            encoding="utf8",
+            delay=True,
+        )
+    else:
+        file_handler = logging.FileHandler(
+            log_file, encoding="utf8", delay=True
+        )
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+    )
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+
     config = {
         "version": 1,
         "disable_existing_loggers": False,
-        "formatters": {
-            "standard": {
-                "format": (
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                )
-            },
-        },
         "handlers": {
-            "file": {
-                "class": "logging.FileHandler",
-                "level": "INFO",
-                "formatter": "standard",
-                "filename": log_file,
-                "encoding": "utf8",
+            # "()" rather than "class" so every supported Python passes
+            # the queue object through unchanged. No formatter here: the
+            # file handler formats on the listener thread.
+            "queue": {
+                "()": logging.handlers.QueueHandler,
+                "queue": log_queue,
             },
             # We can add console handler if we want verbose output,
             # but Typer/Rich handles console mostly.
         },
-        "root": {"level": "INFO", "handlers": ["file"]},
+        "root": {"level": "INFO", "handlers": ["queue"]},
     }
     logging.config.dictConfig(config)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _listener.start()
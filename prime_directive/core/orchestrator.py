@@ -1,52 +1,53 @@
-import asyncio
 import logging
 import os
-from typing import Any, Callable, Optional, cast
+from typing import Any, Callable, Dict, Optional, cast
 
 from sqlalchemy import select
 
 from prime_directive.core.db import ContextSnapshot, EventLog, EventType
+from prime_directive.core.event_loop import run_async
 
 
-def _is_path_prefix(prefix: str, path: str) -> bool:
+def _normalize_path(path: str) -> str:
     """
-    Determine whether `prefix` is a directory path prefix of `path`.
-
-    Paths are normalized and resolved to absolute paths; equality counts as a
-    match.
-    Only directory-boundary prefixes are considered.
-    For example, '/a/b' matches '/a/b/c' but not '/a/bc'.
-
-    Returns:
-        bool: `True` if `prefix` is equal to `path` or is a directory-prefix of
-            `path`, `False` otherwise.
+    Return `path` as a normalized absolute path.
     """
-    prefix_norm = os.path.normpath(os.path.abspath(prefix))
-    path_norm = os.path.normpath(os.path.abspath(path))
+    return os.path.normpath(os.path.abspath(path))
 
-    if path_norm == prefix_norm:
-        return True
 
-    return path_norm.startswith(prefix_norm + os.sep)
+def detect_current_repo_id(cwd: str, repos: Any) -> Optional[str]:
+    """
+    Detect the current repo as the one whose path is the longest directory prefix of `cwd`.
 
+    Repo paths are indexed by their normalized form, then `cwd` is walked up
+    one directory at a time; the first indexed ancestor is the longest
+    match. This costs one dict lookup per path component of `cwd` rather
+    than a prefix comparison per configured repo, and only whole directory
+    names match ('/a/b' matches '/a/b/c' but not '/a/bc'; a repo at '/'
+    matches everything).
 
-def detect_current_repo_id(cwd: str, repos: Any) -> Optional[str]:
-    """Detect current repo by longest matching repo path prefix."""
-    best_repo_id: Optional[str] = None
-    best_len = -1
+    Parameters:
+        cwd (str): Directory to locate; normalized before the lookup.
+        repos (Any): Mapping of repo id to a config with a `path`.
 
+    Returns:
+        Optional[str]: Id of the innermost repo containing `cwd` (the first configured one if several share a path), or None if no repo contains it.
+    """
+    repo_ids_by_path: Dict[str, str] = {}
     for repo_id, repo_cfg in repos.items():
         repo_path = getattr(repo_cfg, "path", None) or repo_cfg.get("path")
-        if not repo_path:
-            continue
-
-        if _is_path_prefix(repo_path, cwd):
-            repo_path_norm = os.path.normpath(os.path.abspath(repo_path))
-            if len(repo_path_norm) > best_len:
-                best_len = len(repo_path_norm)
-                best_repo_id = repo_id
+        if repo_path:
+            repo_ids_by_path.setdefault(_normalize_path(repo_path), repo_id)
 
-    return best_repo_id
+    path = _normalize_path(cwd)
+    while True:
+        repo_id = repo_ids_by_path.get(path)
+        if repo_id is not None:
+            return repo_id
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
 
 
 async def switch_logic(
@@ -123,14 +124,8 @@ async def switch_logic(
 
         await init_db_fn(cfg.system.db_path)
         async for session in get_session_fn(cfg.system.db_path):
-            session.add(
-                EventLog(
-                    repo_id=target_repo_id,
-                    event_type=EventType.SWITCH_IN,
-                )
-            )
-            await session.commit()
-
+            # Read the latest snapshot before adding the event, so the one
+            # transaction only takes the write lock for the commit itself.
             repo_id_col = cast(Any, ContextSnapshot.repo_id)
             ts_col = cast(Any, ContextSnapshot.timestamp)
             stmt = (
@@ -142,6 +137,14 @@ async def switch_logic(
             result = await session.execute(stmt)
             snapshot = result.scalars().first()
 
+            session.add(
+                EventLog(
+                    repo_id=target_repo_id,
+                    event_type=EventType.SWITCH_IN,
+                )
+            )
+            await session.commit()
+
             console.print("\n[bold reverse] SITREP [/bold reverse]")
             if snapshot:
                 if snapshot.human_note:
@@ -213,7 +216,7 @@ def run_switch(
         True if cfg.system.mock_mode is false and the TMUX environment variable
         is not set, False otherwise.
     """
-    asyncio.run(
+    run_async(
         switch_logic(
             target_repo_id,
             cfg,
@@ -67,6 +67,7 @@ async def generate_sitrep(
     timeout_seconds: float = 5.0,
     max_retries: int = 0,
     backoff_seconds: float = 0.0,
+    max_backoff_seconds: float = 30.0,
     db_path: Optional[str] = None,
     monthly_budget_usd: float = 10.0,
     cost_per_1k_tokens: float = 0.002,
@@ -97,6 +98,7 @@ async def generate_sitrep(
         timeout_seconds (float): Request timeout for Ollama calls.
         max_retries (int): Number of retries for Ollama requests.
         backoff_seconds (float): Backoff delay between Ollama retries.
+        max_backoff_seconds (float): Upper bound for a single Ollama retry delay, including one requested by `Retry-After`.
         db_path (Optional[str]): Path to a local DB used for budget checks and logging; if None, budget checks and logging are skipped.
         monthly_budget_usd (float): Monthly budget threshold used when db_path is provided.
         cost_per_1k_tokens (float): Cost estimate per 1000 tokens used to compute estimated cost when logging usage.
@@ -232,6 +234,7 @@ async def generate_sitrep(
             timeout_seconds=timeout_seconds,
             max_retries=max_retries,
             backoff_seconds=backoff_seconds,
+            max_backoff_seconds=max_backoff_seconds,
         )
     except (httpx.HTTPError, ValueError) as e:
         last_error = e
@@ -1,6 +1,13 @@
 import sys
 import pytest
 
+from prime_directive.core.ai_providers import (
+    clear_usage_cache,
+    get_openai_api_key,
+)
+from prime_directive.core.auto_installer import _spec_exists
+from prime_directive.core.dependencies import _ollama_path
+
 
 # each test runs on cwd to its temp dir
 @pytest.fixture(autouse=True)
@@ -12,3 +19,35 @@ def go_to_tmpdir(request):
     # Chdir only for the duration of the test.
     with tmpdir.as_cwd():
         yield
+
+
+# the API key lookup is memoized per process; tests mutate the environment
+@pytest.fixture(autouse=True)
+def clear_api_key_cache():
+    get_openai_api_key.cache_clear()
+    yield
+    get_openai_api_key.cache_clear()
+
+
+# month-to-date usage totals are cached per database path
+@pytest.fixture(autouse=True)
+def clear_monthly_usage_cache():
+    clear_usage_cache()
+    yield
+    clear_usage_cache()
+
+
+# package availability is memoized per process; tests mock find_spec
+@pytest.fixture(autouse=True)
+def clear_package_spec_cache():
+    _spec_exists.cache_clear()
+    yield
+    _spec_exists.cache_clear()
+
+
+# the ollama binary lookup is memoized per process; tests patch shutil.which
+@pytest.fixture(autouse=True)
+def clear_ollama_path_cache():
+    _ollama_path.cache_clear()
+    yield
+    _ollama_path.cache_clear()
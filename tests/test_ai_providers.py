@@ -0,0 +1,445 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from prime_directive.core.ai_providers import (
+    dispose_http_client,
+    generate_ollama,
+    stream_openai_chat,
+)
+
+_RealAsyncClient = httpx.AsyncClient
+
+
+def _client_with(handler):
+    """Build an AsyncClient factory that routes requests to `handler`."""
+
+    def factory(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return _RealAsyncClient(*args, **kwargs)
+
+    return factory
+
+
+def _sse(*events):
+    return "".join(f"data: {event}\n\n" for event in events).encode()
+
+
+async def _collect(**overrides):
+    kwargs = {
+        "api_url": "https://api.example.test/v1/chat/completions",
+        "api_key": "sk-test",
+        "model": "gpt-4o",
+        "system": "sys",
+        "prompt": "prompt",
+        "timeout_seconds": 5.0,
+        "max_tokens": 50,
+    }
+    kwargs.update(overrides)
+    return [chunk async for chunk in stream_openai_chat(**kwargs)]
+
+
+async def test_stream_openai_chat_yields_deltas_in_order():
+    seen = {}
+
+    def handler(request):
+        seen["body"] = request.content
+        body = _sse(
+            '{"choices":[{"delta":{"role":"assistant"}}]}',
+            '{"choices":[{"delta":{"content":"Resume "}}]}',
+            '{"choices":[{"delta":{"content":"the refactor."}}]}',
+            "[DONE]",
+        )
+        return httpx.Response(200, content=body)
+
+    with patch(
+        "prime_directive.core.ai_providers.httpx.AsyncClient",
+        _client_with(handler),
+    ):
+        chunks = await _collect()
+
+    assert chunks == ["Resume ", "the refactor."]
+    assert json.loads(seen["body"])["stream"] is True
+
+
+async def test_stream_openai_chat_raises_on_empty_stream():
+    def handler(request):
+        return httpx.Response(200, content=_sse("[DONE]"))
+
+    with patch(
+        "prime_directive.core.ai_providers.httpx.AsyncClient",
+        _client_with(handler),
+    ):
+        with pytest.raises(ValueError, match="No content"):
+            await _collect()
+
+
+async def test_stream_openai_chat_raises_on_http_error():
+    def handler(request):
+        return httpx.Response(401, json={"error": "bad key"})
+
+    with patch(
+        "prime_directive.core.ai_providers.httpx.AsyncClient",
+        _client_with(handler),
+    ):
+        with pytest.raises(httpx.HTTPStatusError):
+            await _collect()
+
+
+async def test_ai_calls_share_one_http_client():
+    created = []
+    factory = _client_with(
+        lambda request: httpx.Response(200, json={"response": "ok"})
+    )
+
+    def counting_factory(*args, **kwargs):
+        client = factory(*args, **kwargs)
+        created.append(client)
+        return client
+
+    with patch(
+        "prime_directive.core.ai_providers.httpx.AsyncClient",
+        counting_factory,
+    ):
+        for _ in range(3):
+            assert (
+                await generate_ollama(
+                    api_url="http://ollama.test/api/generate",
+                    model="m",
+                    prompt="p",
+                    system="s",
+                    timeout_seconds=1.0,
+                )
+                == "ok"
+            )
+        await dispose_http_client()
+
+    assert len(created) == 1
+    assert created[0].is_closed
+
+
+@pytest.mark.parametrize(
+    "responses, expected_calls",
+    [
+        (
+            [
+                httpx.Response(503),
+                httpx.Response(200, json={"response": "ok"}),
+            ],
+            2,
+        ),
+        ([httpx.Response(404)], 1),
+        ([httpx.Response(200, json={"response": ""})], 1),
+    ],
+)
+async def test_generate_ollama_retries_only_transient_failures(
+    responses, expected_calls
+):
+    pending = list(responses)
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return pending.pop(0)
+
+    with patch(
+        "prime_directive.core.ai_providers.httpx.AsyncClient",
+        _client_with(handler),
+    ):
+        try:
+            await generate_ollama(
+                api_url="http://ollama.test/api/generate",
+                model="m",
+                prompt="p",
+                system="s",
+                timeout_seconds=1.0,
+                max_retries=3,
+            )
+        except (httpx.HTTPStatusError, ValueError):
+            pass
+        await dispose_http_client()
+
+    assert calls == expected_calls
+
+
+async def test_generate_ollama_backoff_is_jittered_and_capped():
+    from prime_directive.core import ai_providers
+
+    req = httpx.Request("POST", "http://ollama.test/api/generate")
+    delays = []
+
+    class RefusingClient:
+        async def post(self, *args, **kwargs):
+            raise httpx.ConnectError("refused", request=req)
+
+    async def record_sleep(seconds):
+        delays.append(seconds)
+
+    with (
+        patch.object(
+            ai_providers, "_get_http_client", return_value=RefusingClient()
+        ),
+        patch.object(ai_providers.asyncio, "sleep", record_sleep),
+    ):
+        with pytest.raises(httpx.ConnectError):
+            await generate_ollama(
+                api_url="http://ollama.test/api/generate",
+                model="m",
+                prompt="p",
+                system="s",
+                timeout_seconds=1.0,
+                max_retries=6,
+                backoff_seconds=1.0,
+                max_backoff_seconds=5.0,
+            )
+
+    assert len(delays) == 6
+    assert all(1.0 <= delay <= 5.0 for delay in delays)
+
+
+async def test_generate_ollama_honors_retry_after_up_to_cap():
+    from prime_directive.core import ai_providers
+
+    req = httpx.Request("POST", "http://ollama.test/api/generate")
+    responses = [
+        httpx.Response(503, headers={"Retry-After": "2"}, request=req),
+        httpx.Response(429, headers={"Retry-After": "120"}, request=req),
+        httpx.Response(200, json={"response": "ok"}, request=req),
+    ]
+    delays = []
+
+    class BusyClient:
+        async def post(self, *args, **kwargs):
+            return responses.pop(0)
+
+    async def record_sleep(seconds):
+        delays.append(seconds)
+
+    with (
+        patch.object(
+            ai_providers, "_get_http_client", return_value=BusyClient()
+        ),
+        patch.object(ai_providers.asyncio, "sleep", record_sleep),
+    ):
+        result = await generate_ollama(
+            api_url="http://ollama.test/api/generate",
+            model="m",
+            prompt="p",
+            system="s",
+            timeout_seconds=1.0,
+            max_retries=2,
+            backoff_seconds=0.0,
+            max_backoff_seconds=10.0,
+        )
+
+    assert result == "ok"
+    assert delays == [2.0, 10.0]
+
+
+def test_retry_after_seconds_parses_http_date():
+    from email.utils import format_datetime
+
+    from prime_directive.core.ai_providers import _retry_after_seconds
+
+    req = httpx.Request("POST", "http://ollama.test/api/generate")
+
+    def error(value):
+        response = httpx.Response(
+            503, headers={"Retry-After": value}, request=req
+        )
+        return httpx.HTTPStatusError("busy", request=req, response=response)
+
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 <= _retry_after_seconds(error(format_datetime(future))) <= 30
+    past = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert _retry_after_seconds(error(format_datetime(past))) == 0.0
+    assert _retry_after_seconds(error("soon")) is None
+    assert _retry_after_seconds(ValueError("bad json")) is None
+
+
+def test_current_month_start_recomputes_on_rollover():
+    from datetime import datetime, timezone
+
+    from prime_directive.core.ai_providers import current_month_start
+
+    jan = datetime(2025, 1, 31, 23, 59, tzinfo=timezone.utc)
+    feb = datetime(2025, 2, 1, 0, 1, tzinfo=timezone.utc)
+
+    assert current_month_start(jan) == datetime(
+        2025, 1, 1, tzinfo=timezone.utc
+    )
+    assert current_month_start(jan) is current_month_start(jan)
+    assert current_month_start(feb) == datetime(
+        2025, 2, 1, tzinfo=timezone.utc
+    )
+
+
+async def test_get_usage_report_combines_totals_and_recent_rows(tmp_path):
+    from prime_directive.core.ai_providers import (
+        get_usage_report,
+        log_ai_usage,
+    )
+    from prime_directive.core.db import dispose_engine
+
+    db_path = str(tmp_path / "report.db")
+    for provider, model, cost in (
+        ("openai", "first", 0.25),
+        ("ollama", "second", 0.0),
+        ("openai", "third", 0.5),
+    ):
+        await log_ai_usage(
+            db_path=db_path,
+            provider=provider,
+            model=model,
+            input_tokens=1,
+            output_tokens=1,
+            cost_estimate_usd=cost,
+            success=True,
+        )
+
+    try:
+        total_cost, call_count, recent = await get_usage_report(
+            db_path, limit=2
+        )
+    finally:
+        await dispose_engine(db_path)
+
+    # Totals cover every OpenAI row, not just the rows returned
+    assert total_cost == pytest.approx(0.75)
+    assert call_count == 2
+    assert [row.model for row in recent] == ["third", "second"]
+
+
+async def test_get_usage_report_empty_database(tmp_path):
+    from prime_directive.core.ai_providers import get_usage_report
+    from prime_directive.core.db import dispose_engine
+
+    db_path = str(tmp_path / "empty.db")
+    try:
+        assert await get_usage_report(db_path) == (0.0, 0, [])
+    finally:
+        await dispose_engine(db_path)
+
+
+async def test_concurrent_usage_logs_share_one_commit(tmp_path):
+    import asyncio
+
+    from prime_directive.core import ai_providers
+    from prime_directive.core.ai_providers import (
+        get_monthly_usage,
+        log_ai_usage,
+    )
+    from prime_directive.core.db import dispose_engine, get_session
+
+    db_path = str(tmp_path / "batched.db")
+    sessions = 0
+
+    async def counting_get_session(path):
+        nonlocal sessions
+        sessions += 1
+        async for session in get_session(path):
+            yield session
+
+    async def log(cost):
+        await log_ai_usage(
+            db_path=db_path,
+            provider="openai",
+            model="gpt-4o-mini",
+            input_tokens=1,
+            output_tokens=1,
+            cost_estimate_usd=cost,
+            success=True,
+        )
+
+    try:
+        with patch(
+            "prime_directive.core.ai_providers.get_session",
+            counting_get_session,
+        ):
+            await asyncio.gather(log(0.25), log(0.5), log(0.25))
+        assert sessions == 1
+        assert not ai_providers._usage_batches
+        assert await get_monthly_usage(db_path) == (1.0, 3)
+    finally:
+        await dispose_engine(db_path)
+
+
+async def test_monthly_usage_is_cached_and_kept_current(tmp_path):
+    from prime_directive.core import ai_providers
+    from prime_directive.core.ai_providers import (
+        get_monthly_usage,
+        log_ai_usage,
+    )
+    from prime_directive.core.db import dispose_engine
+
+    db_path = str(tmp_path / "monthly.db")
+    try:
+        assert await get_monthly_usage(db_path) == (0.0, 0)
+        await log_ai_usage(
+            db_path=db_path,
+            provider="openai",
+            model="gpt-4o-mini",
+            input_tokens=1,
+            output_tokens=1,
+            cost_estimate_usd=0.5,
+            success=True,
+        )
+        with patch(
+            "prime_directive.core.ai_providers.get_session",
+            side_effect=AssertionError("cache should answer"),
+        ):
+            assert await get_monthly_usage(db_path) == (0.5, 1)
+
+        # An expired entry is refreshed from the database
+        with patch.object(ai_providers, "_MONTHLY_USAGE_TTL_SECONDS", 0.0):
+            assert await get_monthly_usage(db_path) == (0.5, 1)
+    finally:
+        await dispose_engine(db_path)
+
+
+async def test_monthly_usage_query_plan_uses_covering_index(tmp_path):
+    from prime_directive.core import ai_providers
+    from prime_directive.core.db import dispose_engine, get_engine, init_db
+
+    db_path = str(tmp_path / "plan.db")
+    await init_db(db_path)
+    engine = get_engine(db_path)
+    compiled = ai_providers._MONTHLY_USAGE_STMT.compile(engine.sync_engine)
+    params = compiled.construct_params(
+        {"month_start": "2025-01-01 00:00:00.000000"}
+    )
+    try:
+        async with engine.connect() as conn:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {compiled}",
+                tuple(params[name] for name in compiled.positiontup),
+            )
+            plan = " ".join(str(row[-1]) for row in result)
+    finally:
+        await dispose_engine(db_path)
+
+    assert "COVERING INDEX ix_aiusagelog_provider_timestamp_cost" in plan
+
+
+@pytest.mark.parametrize("available", [True, False])
+async def test_shared_client_enables_http2_only_when_h2_installed(
+    monkeypatch, available
+):
+    from prime_directive.core import ai_providers
+
+    captured = {}
+
+    def factory(*args, **kwargs):
+        captured.update(kwargs)
+        return _RealAsyncClient()
+
+    monkeypatch.setattr(ai_providers, "_HTTP2_AVAILABLE", available)
+    with patch("prime_directive.core.ai_providers.httpx.AsyncClient", factory):
+        ai_providers._get_http_client()
+        await dispose_http_client()
+
+    assert captured["http2"] is available
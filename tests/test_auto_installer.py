@@ -92,7 +92,16 @@ def test_ensure_packages_missing_auto_install_success(
     ensure_packages(["openai"], auto_install=True)
 
     mock_subprocess.assert_called_once_with(
-        ["/some/venv/bin/python", "-m", "pip", "install", "openai"]
+        [
+            "/some/venv/bin/python",
+            "-m",
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+            "--no-input",
+            "--prefer-binary",
+            "openai",
+        ]
     )
 
 
@@ -119,3 +128,21 @@ def test_ensure_packages_not_in_venv(mock_importlib, mock_subprocess):
         ensure_packages(["openai"], auto_install=True)
 
     mock_subprocess.assert_not_called()
+
+
+def test_ensure_packages_caches_lookups_until_install(
+    mock_importlib, mock_subprocess, mock_sys_prefix
+):
+    mock_importlib.return_value = None
+
+    ensure_packages(["openai"], auto_install=False)
+    ensure_packages(["openai"], auto_install=False)
+    assert mock_importlib.call_count == 1
+
+    # A successful install forgets the cached answers
+    ensure_packages(["openai"], auto_install=True)
+    mock_importlib.return_value = True
+    ensure_packages(["openai"], auto_install=True)
+
+    assert mock_importlib.call_count == 2
+    mock_subprocess.assert_called_once()
@@ -1,3 +1,4 @@
+import json
 import pytest
 from typer.testing import CliRunner
 from unittest.mock import patch, Mock, MagicMock, AsyncMock
@@ -37,6 +38,92 @@ repos:
     assert str(cfg.system.db_path).endswith("custom.db")
 
 
+def test_load_config_is_cached_until_user_config_changes(tmp_path):
+    import os
+
+    config_dir = tmp_path / ".prime-directive"
+    config_dir.mkdir(parents=True)
+    user_config = config_dir / "config.yaml"
+    user_config.write_text("system:\n  editor_cmd: vim\n", encoding="utf-8")
+
+    with patch("prime_directive.bin.pd.Path.home", return_value=tmp_path):
+        first = load_config()
+        assert load_config() is first
+
+        user_config.write_text(
+            "system:\n  editor_cmd: nano\n", encoding="utf-8"
+        )
+        stat = user_config.stat()
+        os.utime(user_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = load_config()
+
+    assert second is not first
+    assert second.system.editor_cmd == "nano"
+
+
+def test_invalidate_config_cache_forces_recompose(tmp_path):
+    from prime_directive.bin.pd import invalidate_config_cache
+
+    with patch("prime_directive.bin.pd.Path.home", return_value=tmp_path):
+        first = load_config()
+        invalidate_config_cache()
+        assert load_config() is not first
+
+
+def test_load_config_reuses_on_disk_cache_without_hydra(tmp_path):
+    from prime_directive.bin import pd
+
+    with patch("prime_directive.bin.pd.Path.home", return_value=tmp_path):
+        first = load_config()
+        cache_files = list(
+            (tmp_path / ".prime-directive" / "cache").glob("config-*.yaml")
+        )
+        assert len(cache_files) == 1
+
+        # A fresh process only has the on-disk copy
+        pd._CONFIG_CACHE.clear()
+        with patch("hydra.compose") as mock_compose:
+            second = load_config()
+        mock_compose.assert_not_called()
+
+        pd.invalidate_config_cache()
+        assert not cache_files[0].exists()
+
+    assert second is not first
+    assert OmegaConf.to_container(second) == OmegaConf.to_container(first)
+
+
+def test_on_disk_config_cache_expands_paths_per_process(tmp_path, monkeypatch):
+    from prime_directive.bin import pd
+
+    config_dir = tmp_path / ".prime-directive"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.yaml").write_text(
+        "system:\n  db_path: $PD_TEST_DATA/prime.db\n"
+        "repos:\n  mine:\n    id: mine\n"
+        "    path: ${oc.env:PD_TEST_REPOS}/mine\n    priority: 1\n",
+        encoding="utf-8",
+    )
+
+    with patch("prime_directive.bin.pd.Path.home", return_value=tmp_path):
+        monkeypatch.setenv("PD_TEST_DATA", "/first/data")
+        monkeypatch.setenv("PD_TEST_REPOS", "/first/repos")
+        first = load_config()
+        assert first.system.db_path == "/first/data/prime.db"
+        assert first.repos.mine.path == "/first/repos/mine"
+
+        # A later process with another environment reads the disk cache
+        pd._CONFIG_CACHE.clear()
+        monkeypatch.setenv("PD_TEST_DATA", "/second/data")
+        monkeypatch.setenv("PD_TEST_REPOS", "/second/repos")
+        with patch("hydra.compose") as mock_compose:
+            second = load_config()
+        mock_compose.assert_not_called()
+
+    assert second.system.db_path == "/second/data/prime.db"
+    assert second.repos.mine.path == "/second/repos/mine"
+
+
 @pytest.fixture
 def mock_config(tmp_path):
     # Use OmegaConf to create a DictConfig that supports dot access
@@ -122,12 +209,9 @@ def test_status_command(
 
     # Mock DB Session
     mock_session = AsyncMock()
-    # Mock result for snapshot query
-    mock_snapshot = MagicMock()
-    mock_snapshot.timestamp.strftime.return_value = "2025-01-01 12:00"
-
+    # Mock result for the grouped latest-snapshot query
     mock_result = MagicMock()
-    mock_result.scalars.return_value.first.return_value = mock_snapshot
+    mock_result.all.return_value = [("repo1", datetime(2025, 1, 1, 12, 0, 42))]
 
     # Make execute return the result (AsyncMock automatically makes it awaitable if we configure it right,
     # but strictly execute returns a coroutine. AsyncMock calls return coroutines.)
@@ -150,15 +234,114 @@ def test_status_command(
     assert "repo1" in result.stdout
     assert "Clean" in result.stdout
     assert "2025-01-01 12:00" in result.stdout
+    assert "Never" in result.stdout  # repo2 has no snapshots
+    # All repos are resolved by a single grouped query
+    mock_session.execute.assert_awaited_once()
 
     # Verify cleanup
     mock_dispose.assert_called_once()
     mock_init_db.assert_awaited_once()
 
 
+@patch("prime_directive.bin.pd.load_config")
+@patch("prime_directive.bin.pd.get_status")
+@patch("prime_directive.bin.pd.init_db", new_callable=AsyncMock)
+@patch("prime_directive.bin.pd.get_session")
+@patch("prime_directive.bin.pd.dispose_engine", new_callable=AsyncMock)
+def test_status_command_overlaps_git_status_calls(
+    mock_dispose,
+    mock_get_session,
+    mock_init_db,
+    mock_get_status,
+    mock_load,
+    mock_config,
+):
+    import asyncio
+
+    mock_load.return_value = mock_config
+    in_flight = 0
+    peak = 0
+
+    async def slow_status(path):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {
+            "branch": "main",
+            "is_dirty": path.endswith("repo2"),
+            "uncommitted_files": ["a.py"],
+        }
+
+    mock_get_status.side_effect = slow_status
+
+    mock_session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute.return_value = mock_result
+
+    async def async_gen(_db_path=None):
+        yield mock_session
+
+    mock_get_session.side_effect = async_gen
+
+    result = runner.invoke(app, ["status"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert peak == 2
+    # Results stay paired with their repo despite running concurrently
+    assert "Dirty (1)" in result.stdout
+    assert "Clean" in result.stdout
+
+
+async def test_fetch_last_snapshot_times_groups_by_repo(tmp_path):
+    from prime_directive.bin.pd import (
+        _fetch_last_snapshot_times,
+        _format_minutes,
+    )
+    from prime_directive.core.db import (
+        ContextSnapshot,
+        Repository,
+        dispose_engine,
+        get_session,
+        init_db,
+    )
+
+    db_path = str(tmp_path / "status.db")
+    await init_db(db_path)
+    try:
+        async for session in get_session(db_path):
+            session.add(Repository(id="a", path="/tmp/a", priority=1))
+            session.add(Repository(id="b", path="/tmp/b", priority=1))
+            await session.flush()
+            for repo_id, hour in (("a", 1), ("a", 3), ("b", 2)):
+                session.add(
+                    ContextSnapshot(
+                        repo_id=repo_id,
+                        timestamp=datetime(
+                            2025, 1, 1, hour, tzinfo=timezone.utc
+                        ),
+                        git_status_summary="",
+                        terminal_last_command="",
+                        terminal_output_summary="",
+                        ai_sitrep="",
+                    )
+                )
+            await session.commit()
+
+            latest = await _fetch_last_snapshot_times(session, ["a", "b", "c"])
+    finally:
+        await dispose_engine(db_path)
+
+    assert {
+        repo_id: _format_minutes(ts) for repo_id, ts in latest.items()
+    } == {"a": "2025-01-01 03:00", "b": "2025-01-01 02:00"}
+
+
 @patch("prime_directive.bin.pd.load_config")
 @patch("shutil.which")
-@patch("requests.get")
+@patch("httpx.Client.get")
 @patch("os.path.exists")
 def test_doctor_command(
     mock_exists, mock_get, mock_which, mock_load, mock_config
@@ -175,27 +358,32 @@ def test_doctor_command(
 
     mock_which.side_effect = which_side_effect
 
-    # Mock requests.get (Ollama)
+    # Mock httpx.Client.get (Ollama)
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "models": [{"name": "gpt-4:latest"}]
-    }  # Matches mock_config model
+    mock_response.content = json.dumps(
+        {"models": [{"name": "gpt-4:latest"}]}
+    ).encode()  # Matches mock_config model
     mock_get.return_value = mock_response
 
     # Mock os.path.exists
     mock_exists.return_value = True
 
-    result = runner.invoke(app, ["doctor"])
+    with patch(
+        "prime_directive.core.dependencies.close_http_client"
+    ) as mock_close:
+        result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 0
     assert "Prime Directive Doctor" in result.stdout
     assert "Tmux Installed" in result.stdout
     assert "✅" in result.stdout
+    # The probe client is released once the checks are done
+    mock_close.assert_called_once_with()
 
 
 @patch("prime_directive.bin.pd.load_config")
 @patch("shutil.which")
-@patch("requests.get")
+@patch("httpx.Client.get")
 @patch("os.path.exists")
 def test_doctor_detects_multiple_installations(
     mock_exists, mock_get, mock_which, mock_load, mock_config, tmp_path
@@ -214,7 +402,9 @@ def test_doctor_detects_multiple_installations(
 
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"models": [{"name": "gpt-4:latest"}]}
+    mock_response.content = json.dumps(
+        {"models": [{"name": "gpt-4:latest"}]}
+    ).encode()
     mock_get.return_value = mock_response
 
     mock_exists.return_value = True
@@ -233,6 +423,31 @@ def test_doctor_detects_multiple_installations(
     assert "⚠️" in result.stdout or "Multiple installs" in result.stdout
 
 
+@patch("prime_directive.bin.pd.load_config")
+@patch("os.path.exists")
+def test_doctor_stats_each_distinct_repo_path_once(
+    mock_exists, mock_load, mock_config
+):
+    conf_dict = OmegaConf.to_container(mock_config, resolve=True)
+    conf_dict["system"]["mock_mode"] = True
+    for repo in conf_dict["repos"].values():
+        repo["path"] = "/shared/checkout"
+    mock_load.return_value = OmegaConf.create(conf_dict)
+    mock_exists.return_value = True
+
+    result = runner.invoke(app, ["doctor"])
+
+    assert result.exit_code == 0
+    assert "repo1: /shared/checkout" in result.stdout
+    assert "repo2: /shared/checkout" in result.stdout
+    shared_calls = [
+        c
+        for c in mock_exists.call_args_list
+        if c.args == ("/shared/checkout",)
+    ]
+    assert len(shared_calls) == 1
+
+
 @patch("prime_directive.bin.pd.load_config")
 def test_install_hooks_creates_post_commit(mock_load, tmp_path, mock_config):
     repo_path = tmp_path / "repo1"
@@ -406,3 +621,98 @@ def test_metrics_reports_ttc(
     assert result.exit_code == 0
     assert "Prime Directive Metrics" in result.stdout
     assert "repo1" in result.stdout
+
+
+def test_format_minutes_drops_seconds_and_offset():
+    from prime_directive.bin.pd import _format_minutes
+
+    naive = datetime(2025, 3, 4, 5, 6, 7, 890)
+    aware = datetime(2025, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+
+    assert _format_minutes(naive) == "2025-03-04 05:06"
+    assert _format_minutes(aware) == "2025-03-04 05:06"
+    assert _format_minutes(naive)[5:] == "03-04 05:06"
+
+
+@pytest.mark.parametrize(
+    "total_cost, expected",
+    [
+        (9.5, "95.0% of budget used!"),
+        (8.0, "80.0% of budget used"),
+        (1.0, "10.0% of budget used"),
+    ],
+)
+@patch("prime_directive.bin.pd.load_config")
+@patch("prime_directive.bin.pd.init_db", new_callable=AsyncMock)
+@patch("prime_directive.bin.pd.dispose_engine", new_callable=AsyncMock)
+def test_ai_usage_budget_bands(
+    mock_dispose, mock_init_db, mock_load, mock_config, total_cost, expected
+):
+    mock_config.system.ai_monthly_budget_usd = 10.0
+    mock_load.return_value = mock_config
+
+    with patch(
+        "prime_directive.core.ai_providers.get_usage_report",
+        new_callable=AsyncMock,
+        return_value=(total_cost, 3, []),
+    ):
+        result = runner.invoke(app, ["ai-usage"])
+
+    assert result.exit_code == 0
+    assert expected in result.stdout
+    mock_dispose.assert_awaited_once()
+
+
+def test_cli_import_does_not_load_hydra_or_watchdog():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, prime_directive.bin.pd; "
+        "print(sorted({m.split('.')[0] for m in sys.modules} "
+        "& {'hydra', 'watchdog', 'requests'}))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert out.strip() == "[]"
+
+
+def test_repos_by_priority_sorts_once_per_config(mock_config):
+    from prime_directive.bin.pd import repos_by_priority
+
+    first = repos_by_priority(mock_config)
+    assert [repo.priority for repo in first] == sorted(
+        (repo.priority for repo in mock_config.repos.values()), reverse=True
+    )
+    assert repos_by_priority(mock_config) is first
+
+    other = OmegaConf.create(OmegaConf.to_container(mock_config))
+    assert repos_by_priority(other) is not first
+
+
+@patch("prime_directive.bin.pd.load_config")
+@patch("prime_directive.bin.pd.freeze_logic", new_callable=AsyncMock)
+@patch("prime_directive.bin.pd.dispose_http_client", new_callable=AsyncMock)
+@patch("prime_directive.bin.pd.dispose_engine", new_callable=AsyncMock)
+def test_freeze_command_closes_shared_http_client(
+    mock_dispose_engine,
+    mock_dispose_http,
+    mock_freeze,
+    mock_load,
+    mock_config,
+):
+    mock_load.return_value = mock_config
+
+    result = runner.invoke(
+        app, ["freeze", "repo1", "--no-interview"], catch_exceptions=False
+    )
+
+    assert result.exit_code == 0
+    mock_freeze.assert_awaited_once()
+    mock_dispose_http.assert_awaited_once()
+    mock_dispose_engine.assert_awaited_once()
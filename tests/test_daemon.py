@@ -1,9 +1,10 @@
+import asyncio
 import pytest
 import time
 from unittest.mock import patch, MagicMock, AsyncMock
 from prime_directive.bin.pd_daemon import AutoFreezeHandler, main
 from omegaconf import OmegaConf
-from datetime import datetime, timedelta
+from watchdog.events import FileModifiedEvent
 
 
 @pytest.fixture
@@ -45,7 +46,7 @@ def test_handler_update():
     event.src_path = "/tmp/test-repo/file.py"
 
     time.sleep(0.01)  # Ensure time advances
-    handler.on_any_event(event)
+    handler.on_modified(event)
 
     assert handler.last_modified > initial_time
     assert handler.is_frozen is False  # Verify reset
@@ -53,11 +54,15 @@ def test_handler_update():
 
 @patch("prime_directive.bin.pd_daemon.load_config")
 @patch("prime_directive.bin.pd_daemon.Observer")
-@patch("prime_directive.bin.pd_daemon.asyncio.sleep", new_callable=AsyncMock)
+@patch(
+    "prime_directive.bin.pd_daemon._wait_for_activity", new_callable=AsyncMock
+)
 @patch("prime_directive.bin.pd_daemon.freeze_logic", new_callable=AsyncMock)
 @patch("prime_directive.bin.pd_daemon.os.path.exists")
 @patch("prime_directive.bin.pd_daemon._should_skip_terminal_capture")
+@patch("prime_directive.bin.pd_daemon.dispose_engine", new_callable=AsyncMock)
 def test_daemon_loop(
+    mock_dispose,
     mock_should_skip,
     mock_exists,
     mock_freeze,
@@ -84,13 +89,13 @@ def test_daemon_loop(
         "prime_directive.bin.pd_daemon.AutoFreezeHandler"
     ) as MockHandlerClass:
         mock_handler = MagicMock()
-        # Set last_modified to 1 hour ago
-        mock_handler.last_modified = datetime.now() - timedelta(hours=1)
+        # Set last_modified to 1 hour ago (monotonic seconds)
+        mock_handler.last_modified = time.monotonic() - 3600
         # Explicitly set is_frozen to False so logic triggers
         mock_handler.is_frozen = False
         MockHandlerClass.return_value = mock_handler
 
-        main(interval=1, inactivity_limit=1800)  # 30 mins limit
+        main(interval=1, inactivity_limit=1800, polling=False)  # 30 min
 
         # Verify monitoring started
         observer_instance.schedule.assert_called_once()
@@ -105,3 +110,364 @@ def test_daemon_loop(
 
         # Verify handler state updated
         assert mock_handler.is_frozen is True
+
+        # The engine outlives individual freezes and is released on exit
+        mock_dispose.assert_awaited_once()
+
+
+def test_handler_throttles_and_ignores_noise():
+    handler = AutoFreezeHandler("test-repo", None, repo_path="/tmp/test-repo")
+    handler.last_modified = 0.0
+
+    noisy = MagicMock()
+    noisy.is_directory = False
+    noisy.src_path = "/tmp/test-repo/node_modules/pkg/index.js"
+    handler.on_modified(noisy)
+    assert handler.last_modified == 0.0
+
+    event = MagicMock()
+    event.is_directory = False
+    event.src_path = "/tmp/test-repo/src/app.py"
+    handler.on_modified(event)
+    first = handler.last_modified
+    assert first > 0.0
+
+    # A burst of events within the throttle window is coalesced
+    handler.is_frozen = True
+    handler.on_modified(event)
+    assert handler.last_modified == first
+    assert handler.is_frozen is True
+
+
+@patch("prime_directive.bin.pd_daemon.load_config")
+@patch("prime_directive.bin.pd_daemon.Observer")
+@patch("prime_directive.bin.pd_daemon.PollingObserver")
+@patch(
+    "prime_directive.bin.pd_daemon._wait_for_activity", new_callable=AsyncMock
+)
+@patch("prime_directive.bin.pd_daemon.os.path.exists")
+@patch("prime_directive.bin.pd_daemon.dispose_engine", new_callable=AsyncMock)
+def test_daemon_polling_observer(
+    mock_dispose,
+    mock_exists,
+    mock_sleep,
+    mock_polling_observer,
+    mock_observer,
+    mock_load,
+    mock_config,
+):
+    mock_load.return_value = mock_config
+    mock_exists.return_value = True
+    mock_sleep.side_effect = KeyboardInterrupt
+
+    main(interval=7, inactivity_limit=1800, polling=True)
+
+    mock_polling_observer.assert_called_once_with(timeout=7)
+    mock_observer.assert_not_called()
+    mock_polling_observer.return_value.schedule.assert_called_once()
+
+
+@patch("prime_directive.bin.pd_daemon.load_config")
+@patch("prime_directive.bin.pd_daemon.Observer")
+@patch(
+    "prime_directive.bin.pd_daemon._wait_for_activity", new_callable=AsyncMock
+)
+@patch("prime_directive.bin.pd_daemon.freeze_logic", new_callable=AsyncMock)
+@patch("prime_directive.bin.pd_daemon.os.path.exists")
+@patch("prime_directive.bin.pd_daemon.dispose_engine", new_callable=AsyncMock)
+def test_daemon_sleeps_until_earliest_deadline(
+    mock_dispose,
+    mock_exists,
+    mock_freeze,
+    mock_sleep,
+    mock_observer,
+    mock_load,
+    mock_config,
+):
+    mock_load.return_value = mock_config
+    mock_exists.return_value = True
+    mock_sleep.side_effect = KeyboardInterrupt
+
+    with patch(
+        "prime_directive.bin.pd_daemon.AutoFreezeHandler"
+    ) as MockHandlerClass:
+        mock_handler = MagicMock()
+        # Active 100s ago: stale in ~1700s, well past the 1s interval
+        mock_handler.last_modified = time.monotonic() - 100
+        mock_handler.is_frozen = False
+        MockHandlerClass.return_value = mock_handler
+
+        main(interval=1, inactivity_limit=1800, polling=False)
+
+    wait = mock_sleep.call_args.args[1]
+    assert 1690 < wait <= 1700
+    mock_freeze.assert_not_called()
+
+
+def test_make_observer_uses_coarse_polling_when_native_backend_missing():
+    from prime_directive.bin import pd_daemon
+
+    # On platforms without a native backend watchdog aliases Observer to
+    # PollingObserver
+    fallback = MagicMock()
+    with (
+        patch.object(pd_daemon, "Observer", fallback),
+        patch.object(pd_daemon, "PollingObserver", fallback),
+    ):
+        observer = pd_daemon._make_observer(False, 120)
+
+    fallback.assert_called_once_with(timeout=120)
+    assert observer is fallback.return_value
+
+
+def test_handler_ignores_open_and_close_events():
+    from watchdog.events import FileClosedNoWriteEvent, FileOpenedEvent
+
+    handler = AutoFreezeHandler("test-repo", None, repo_path="/tmp/test-repo")
+    handler.last_modified = 0.0
+    handler.is_frozen = True
+
+    handler.dispatch(FileOpenedEvent("/tmp/test-repo/app.py"))
+    handler.dispatch(FileClosedNoWriteEvent("/tmp/test-repo/app.py"))
+    assert handler.last_modified == 0.0
+    assert handler.is_frozen is True
+
+    handler.dispatch(FileModifiedEvent("/tmp/test-repo/app.py"))
+    assert handler.last_modified > 0.0
+    assert handler.is_frozen is False
+
+
+@patch("prime_directive.bin.pd_daemon.load_config")
+@patch("prime_directive.bin.pd_daemon.Observer")
+@patch(
+    "prime_directive.bin.pd_daemon._wait_for_activity", new_callable=AsyncMock
+)
+@patch("prime_directive.bin.pd_daemon.freeze_logic", new_callable=AsyncMock)
+@patch("prime_directive.bin.pd_daemon.os.path.exists")
+@patch("prime_directive.bin.pd_daemon._should_skip_terminal_capture")
+@patch("prime_directive.bin.pd_daemon.dispose_engine", new_callable=AsyncMock)
+def test_daemon_freezes_due_repos_together(
+    mock_dispose,
+    mock_should_skip,
+    mock_exists,
+    mock_freeze,
+    mock_sleep,
+    mock_observer,
+    mock_load,
+    mock_config,
+):
+    mock_config.repos["other-repo"] = {
+        "id": "other-repo",
+        "path": "/tmp/other-repo",
+        "priority": 5,
+        "active_branch": "main",
+    }
+    mock_load.return_value = mock_config
+    mock_exists.return_value = True
+    mock_should_skip.return_value = True
+    mock_sleep.side_effect = [None, KeyboardInterrupt]
+
+    async def freeze(repo_id, _cfg, **_kwargs):
+        if repo_id == "other-repo":
+            raise OSError("disk full")
+
+    mock_freeze.side_effect = freeze
+
+    stale = {}
+
+    def make_handler(repo_id, _cfg, repo_path=None):
+        handler = MagicMock()
+        handler.last_modified = time.monotonic() - 3600
+        handler.is_frozen = False
+        stale[repo_id] = handler
+        return handler
+
+    with (
+        patch(
+            "prime_directive.bin.pd_daemon.AutoFreezeHandler",
+            side_effect=make_handler,
+        ),
+        patch(
+            "prime_directive.bin.pd_daemon.asyncio.gather",
+            wraps=asyncio.gather,
+        ) as mock_gather,
+    ):
+        main(interval=1, inactivity_limit=1800, polling=False)
+
+    # Both repos were frozen in a single concurrent batch
+    assert mock_gather.call_count == 1
+    assert len(mock_gather.call_args.args) == 2
+    assert stale["test-repo"].is_frozen is True
+    # A failed freeze leaves the repo eligible for a retry
+    assert stale["other-repo"].is_frozen is False
+
+
+@patch("prime_directive.bin.pd_daemon.load_config")
+@patch("prime_directive.bin.pd_daemon.Observer")
+@patch(
+    "prime_directive.bin.pd_daemon._wait_for_activity", new_callable=AsyncMock
+)
+@patch("prime_directive.bin.pd_daemon.freeze_logic", new_callable=AsyncMock)
+@patch("prime_directive.bin.pd_daemon.os.path.exists")
+@patch("prime_directive.bin.pd_daemon._should_skip_terminal_capture")
+@patch("prime_directive.bin.pd_daemon.dispose_engine", new_callable=AsyncMock)
+def test_daemon_frozen_repos_wait_for_activity(
+    mock_dispose,
+    mock_should_skip,
+    mock_exists,
+    mock_freeze,
+    mock_sleep,
+    mock_observer,
+    mock_load,
+    mock_config,
+):
+    mock_load.return_value = mock_config
+    mock_exists.return_value = True
+    mock_should_skip.return_value = True
+    mock_handler = MagicMock()
+    mock_handler.last_modified = time.monotonic() - 3600
+    mock_handler.is_frozen = False
+    timeouts = []
+
+    async def wait_for_activity(_wake, timeout):
+        timeouts.append(timeout)
+        if len(timeouts) == 2:
+            # An edit arrives on the observer thread
+            mock_handler.is_frozen = False
+            mock_handler.last_modified = time.monotonic()
+            mock_handler.on_unfreeze()
+            await asyncio.sleep(0)
+        elif len(timeouts) == 3:
+            raise KeyboardInterrupt
+
+    mock_sleep.side_effect = wait_for_activity
+
+    with patch(
+        "prime_directive.bin.pd_daemon.AutoFreezeHandler",
+        return_value=mock_handler,
+    ):
+        main(interval=1, inactivity_limit=1800, polling=False)
+
+    assert mock_freeze.await_count == 1
+    # Frozen with nothing else scheduled: no timer at all
+    assert timeouts[1] is None
+    # Activity re-armed the repo's inactivity deadline
+    assert 1790 < timeouts[2] <= 1800
+
+
+@pytest.mark.asyncio
+async def test_wait_for_activity_returns_on_wake_or_timeout():
+    from prime_directive.bin.pd_daemon import _wait_for_activity
+
+    wake = asyncio.Event()
+    await _wait_for_activity(wake, 0.01)
+    assert not wake.is_set()
+
+    asyncio.get_running_loop().call_soon(wake.set)
+    await asyncio.wait_for(_wait_for_activity(wake, None), 1)
+    assert not wake.is_set()
+
+
+@patch("prime_directive.bin.pd_daemon.load_config")
+@patch("prime_directive.bin.pd_daemon.Observer")
+@patch(
+    "prime_directive.bin.pd_daemon._wait_for_activity", new_callable=AsyncMock
+)
+@patch("prime_directive.bin.pd_daemon.os.path.exists")
+@patch("prime_directive.bin.pd_daemon.dispose_engine", new_callable=AsyncMock)
+def test_daemon_runs_on_preferred_event_loop(
+    mock_dispose,
+    mock_exists,
+    mock_sleep,
+    mock_observer,
+    mock_load,
+    mock_config,
+    monkeypatch,
+):
+    from prime_directive.core import event_loop
+
+    mock_load.return_value = mock_config
+    mock_exists.return_value = True
+    mock_sleep.side_effect = KeyboardInterrupt
+    created = []
+
+    class FakeUvloop:
+        @staticmethod
+        def new_event_loop():
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+    monkeypatch.setattr(event_loop, "uvloop", FakeUvloop)
+
+    main(interval=1, inactivity_limit=1800, polling=False)
+
+    assert len(created) == 1
+    mock_dispose.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "returncode, stdout, expected",
+    [
+        (1, b"", False),  # no such session
+        (0, b"", False),  # session without clients
+        (0, b"/dev/pts/3\n", True),
+    ],
+)
+def test_tmux_client_probe_uses_one_subprocess(returncode, stdout, expected):
+    from prime_directive.bin import pd_daemon
+
+    with (
+        patch.object(pd_daemon.shutil, "which", return_value="/usr/bin/tmux"),
+        patch.object(
+            pd_daemon.subprocess,
+            "run",
+            return_value=MagicMock(returncode=returncode, stdout=stdout),
+        ) as mock_run,
+    ):
+        assert pd_daemon._tmux_session_has_active_clients("pd-x") is expected
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0][:4] == [
+        "tmux",
+        "list-clients",
+        "-t",
+        "pd-x",
+    ]
+
+
+@patch("prime_directive.bin.pd_daemon.load_config")
+@patch("prime_directive.bin.pd_daemon.Observer")
+@patch(
+    "prime_directive.bin.pd_daemon._wait_for_activity", new_callable=AsyncMock
+)
+@patch("prime_directive.bin.pd_daemon.dispose_engine", new_callable=AsyncMock)
+def test_daemon_only_watches_existing_repos(
+    mock_dispose,
+    mock_sleep,
+    mock_observer,
+    mock_load,
+    mock_config,
+    tmp_path,
+):
+    mock_config.repos["test-repo"].path = str(tmp_path)
+    mock_config.repos["missing-repo"] = {
+        "id": "missing-repo",
+        "path": str(tmp_path / "missing"),
+        "priority": 5,
+        "active_branch": "main",
+    }
+    mock_load.return_value = mock_config
+    mock_sleep.side_effect = KeyboardInterrupt
+
+    main(interval=1, inactivity_limit=1800, polling=False)
+
+    schedule = mock_observer.return_value.schedule
+    schedule.assert_called_once()
+    assert schedule.call_args.args[1] == str(tmp_path)
+
+
+def test_daemon_log_path_is_next_to_cli_log():
+    from prime_directive.bin.pd_daemon import daemon_log_path
+
+    assert daemon_log_path("/var/log/pd/pd.log") == "/var/log/pd/pd-daemon.log"
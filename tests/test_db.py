@@ -1,3 +1,4 @@
+import os
 import pytest
 import pytest_asyncio
 from sqlmodel import select
@@ -142,3 +143,148 @@ async def test_ai_usage_log_insert(async_db_session):
     fetched = result.scalars().first()
     assert fetched is not None
     assert fetched.model == "gpt-4o-mini"
+
+
+@pytest.mark.asyncio
+async def test_init_db_runs_migrations_once_per_engine(tmp_path):
+    from unittest.mock import AsyncMock, patch
+
+    db_path = str(tmp_path / "once.db")
+    with patch(
+        "prime_directive.core.db.migrate_db", new_callable=AsyncMock
+    ) as mock_migrate:
+        await init_db(db_path)
+        await init_db(db_path)
+        assert mock_migrate.await_count == 1
+
+        # Disposing the engine forgets the database, so init runs again
+        await dispose_engine(db_path)
+        await init_db(db_path)
+        assert mock_migrate.await_count == 2
+
+    await dispose_engine(db_path)
+
+
+@pytest.mark.asyncio
+async def test_migrate_db_adds_snapshot_index_to_v1_database(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "v1.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE contextsnapshot (
+            id INTEGER PRIMARY KEY,
+            repo_id VARCHAR NOT NULL,
+            timestamp DATETIME NOT NULL
+        );
+        PRAGMA user_version = 1;
+        """)
+    conn.close()
+
+    await init_db(db_path)
+    await dispose_engine(db_path)
+
+    conn = sqlite3.connect(db_path)
+    indexes = {
+        row[1] for row in conn.execute("PRAGMA index_list('contextsnapshot')")
+    }
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    plan = " ".join(
+        str(row[-1])
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM contextsnapshot "
+            "WHERE repo_id = 'r' ORDER BY timestamp DESC LIMIT 1"
+        )
+    )
+    conn.close()
+
+    assert "ix_contextsnapshot_repo_id_timestamp" in indexes
+    assert version == 3
+    assert "ix_contextsnapshot_repo_id_timestamp" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_concurrent_init_db_shares_one_migration(tmp_path):
+    import asyncio
+    from unittest.mock import patch
+
+    db_path = str(tmp_path / "concurrent.db")
+    calls = 0
+
+    async def slow_migrate(_db_path):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+
+    with patch("prime_directive.core.db.migrate_db", side_effect=slow_migrate):
+        await asyncio.gather(init_db(db_path), init_db(db_path))
+
+    assert calls == 1
+    await dispose_engine(db_path)
+
+
+@pytest.mark.asyncio
+async def test_monthly_usage_aggregate_uses_covering_index(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "usage.db")
+    await init_db(db_path)
+    await dispose_engine(db_path)
+
+    conn = sqlite3.connect(db_path)
+    plan = " ".join(
+        str(row[-1])
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT coalesce(sum(cost_estimate_usd), 0.0), "
+            "count(1) FROM aiusagelog "
+            "WHERE timestamp >= '2025-01-01' AND provider = 'openai'"
+        )
+    )
+    conn.close()
+
+    assert "COVERING INDEX ix_aiusagelog_provider_timestamp_cost" in plan
+
+
+@pytest.mark.asyncio
+async def test_session_factory_is_cached_per_engine(tmp_path):
+    from prime_directive.core.db import get_engine, get_session_factory
+
+    db_path = str(tmp_path / "factory.db")
+    factory = get_session_factory(db_path)
+    assert get_session_factory(db_path) is factory
+    assert factory.kw["bind"] is get_engine(db_path)
+
+    # Disposing the engine drops its factory as well
+    await dispose_engine(db_path)
+    assert get_session_factory(db_path) is not factory
+    await dispose_engine(db_path)
+
+
+@pytest.mark.asyncio
+async def test_get_engine_creates_parent_directory_once(tmp_path):
+    from unittest.mock import patch
+
+    from prime_directive.core.db import get_engine
+
+    # Engines connect lazily, so a mocked makedirs never touches disk
+    db_path = str(tmp_path / "nested" / "once.db")
+    with patch("prime_directive.core.db.os.makedirs") as makedirs:
+        get_engine(db_path)
+        await dispose_engine(db_path)
+        get_engine(db_path)
+        await dispose_engine(db_path)
+
+    makedirs.assert_called_once_with(os.path.dirname(db_path), exist_ok=True)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_performance_pragmas(async_db_session):
+    async def pragma(name):
+        result = await async_db_session.execute(text(f"PRAGMA {name};"))
+        return result.scalar_one()
+
+    assert await pragma("synchronous") == 1  # NORMAL
+    assert await pragma("cache_size") == -20000
+    assert await pragma("temp_store") == 2  # MEMORY
+    assert await pragma("foreign_keys") == 1
@@ -1,6 +1,7 @@
+import json
 from unittest.mock import patch, Mock
 
-import requests
+import httpx
 
 from prime_directive.core.dependencies import (
     get_ollama_install_cmd,
@@ -36,8 +37,8 @@ def test_get_ollama_status_installed_not_running():
     with (
         patch("shutil.which", return_value="/usr/bin/ollama"),
         patch(
-            "requests.get",
-            side_effect=requests.exceptions.ConnectionError("refused"),
+            "httpx.Client.get",
+            side_effect=httpx.ConnectError("refused"),
         ),
     ):
         status = get_ollama_status("qwen2.5-coder")
@@ -49,11 +50,13 @@ def test_get_ollama_status_installed_not_running():
 def test_get_ollama_status_running_model_missing():
     mock_resp = Mock()
     mock_resp.status_code = 200
-    mock_resp.json.return_value = {"models": [{"name": "other-model:latest"}]}
+    mock_resp.content = json.dumps(
+        {"models": [{"name": "other-model:latest"}]}
+    ).encode()
 
     with (
         patch("shutil.which", return_value="/usr/bin/ollama"),
-        patch("requests.get", return_value=mock_resp),
+        patch("httpx.Client.get", return_value=mock_resp),
     ):
         status = get_ollama_status("qwen2.5-coder")
         assert status.installed is True
@@ -64,13 +67,13 @@ def test_get_ollama_status_running_model_missing():
 def test_get_ollama_status_running_model_present():
     mock_resp = Mock()
     mock_resp.status_code = 200
-    mock_resp.json.return_value = {
-        "models": [{"name": "qwen2.5-coder:latest"}]
-    }
+    mock_resp.content = json.dumps(
+        {"models": [{"name": "qwen2.5-coder:latest"}]}
+    ).encode()
 
     with (
         patch("shutil.which", return_value="/usr/bin/ollama"),
-        patch("requests.get", return_value=mock_resp),
+        patch("httpx.Client.get", return_value=mock_resp),
     ):
         status = get_ollama_status("qwen2.5-coder")
         assert status.installed is True
@@ -86,3 +89,82 @@ def test_has_openai_api_key_true():
 def test_has_openai_api_key_false():
     with patch.dict("os.environ", {}, clear=True):
         assert has_openai_api_key() is False
+
+
+def test_http_client_is_shared_until_closed():
+    from prime_directive.core import dependencies
+
+    first = dependencies._get_http_client()
+    assert dependencies._get_http_client() is first
+
+    dependencies.close_http_client()
+    assert first.is_closed
+    second = dependencies._get_http_client()
+    assert second is not first
+    dependencies.close_http_client()
+
+
+def test_has_openai_api_key_is_memoized():
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"}, clear=True):
+        assert has_openai_api_key() is True
+    with patch.dict("os.environ", {}, clear=True):
+        # Read once per process until the cache is cleared.
+        assert has_openai_api_key() is True
+
+
+def test_ollama_probe_fails_fast_on_connect():
+    ok_resp = Mock()
+    ok_resp.status_code = 200
+    ok_resp.content = json.dumps({"models": []}).encode()
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/ollama"),
+        patch("httpx.Client.get", return_value=ok_resp) as mock_get,
+    ):
+        get_ollama_status("qwen2.5-coder")
+
+    timeout = mock_get.call_args.kwargs["timeout"]
+    assert timeout.connect == 0.25
+    assert timeout.read == 2.0
+
+
+def test_get_ollama_status_unparsable_tags_is_one_request():
+    mock_resp = Mock()
+    mock_resp.status_code = 200
+    mock_resp.content = b"not json"
+
+    with (
+        patch("shutil.which", return_value="/usr/bin/ollama"),
+        patch("httpx.Client.get", return_value=mock_resp) as mock_get,
+    ):
+        status = get_ollama_status("qwen2.5-coder")
+
+    assert status.running is True
+    assert "missing" in status.details.lower()
+    mock_get.assert_called_once()
+
+
+def test_has_model_matches_exact_names_and_tags_only():
+    from prime_directive.core.dependencies import _has_model
+
+    names = frozenset({"qwen2.5-coder:7b", "llama3", "llama3.1:latest"})
+
+    assert _has_model(names, "llama3")
+    assert _has_model(names, "qwen2.5-coder")
+    assert _has_model(names, "llama3.1")
+    assert not _has_model(names, "qwen2.5")
+    assert not _has_model(names, "llama")
+
+
+def test_ollama_binary_is_resolved_once():
+    from prime_directive.core.dependencies import (
+        _ollama_path,
+        is_ollama_installed,
+    )
+
+    with patch("shutil.which", return_value="/usr/bin/ollama") as which:
+        assert is_ollama_installed() is True
+        assert is_ollama_installed() is True
+        assert _ollama_path() == "/usr/bin/ollama"
+
+    which.assert_called_once_with("ollama")
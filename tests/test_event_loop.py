@@ -0,0 +1,46 @@
+import asyncio
+
+from prime_directive.core import event_loop
+from prime_directive.core.event_loop import (
+    event_runner,
+    loop_factory,
+    run_async,
+)
+
+
+def test_run_async_returns_coroutine_result():
+    async def work():
+        await asyncio.sleep(0)
+        return 42
+
+    assert run_async(work()) == 42
+
+
+def test_loop_factory_falls_back_without_uvloop(monkeypatch):
+    monkeypatch.setattr(event_loop, "uvloop", None)
+
+    assert loop_factory() is None
+
+
+def test_loop_factory_prefers_uvloop_when_installed(monkeypatch):
+    class FakeUvloop:
+        @staticmethod
+        def new_event_loop():
+            return asyncio.new_event_loop()
+
+    monkeypatch.setattr(event_loop, "uvloop", FakeUvloop)
+
+    assert loop_factory() is FakeUvloop.new_event_loop
+    assert run_async(asyncio.sleep(0, result="ok")) == "ok"
+
+
+def test_event_runner_shares_one_loop_across_runs():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    with event_runner() as runner:
+        first = runner.run(current_loop())
+        second = runner.run(current_loop())
+
+    assert first is second
+    assert first.is_closed()
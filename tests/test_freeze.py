@@ -135,15 +135,17 @@ def test_freeze_command(
     assert "SITREP: Fixed bug." in result.stdout
     assert "YOUR NOTE:" in result.stdout
 
-    # Verify DB calls - now adds Repository first, then ContextSnapshot
+    # Verify DB calls - adds Repository first, then inserts the snapshot
     assert mock_session.add.call_count >= 1
-    # Get the last add call which should be the snapshot
-    snapshot = mock_session.add.call_args_list[-1][0][0]
-    assert snapshot.repo_id == "test-repo"
-    assert snapshot.human_note == "Testing freeze command"
-    assert snapshot.human_objective == "Testing objective"
-    assert snapshot.human_blocker == "Testing blocker"
-    assert snapshot.human_next_step == "Testing next step"
+    # The last execute call should be the snapshot INSERT ... RETURNING
+    insert_stmt = mock_session.execute.call_args_list[-1][0][0]
+    assert insert_stmt.table.name == "contextsnapshot"
+    snapshot = insert_stmt.compile().params
+    assert snapshot["repo_id"] == "test-repo"
+    assert snapshot["human_note"] == "Testing freeze command"
+    assert snapshot["human_objective"] == "Testing objective"
+    assert snapshot["human_blocker"] == "Testing blocker"
+    assert snapshot["human_next_step"] == "Testing next step"
 
     mock_init_db.assert_awaited_once()
 
@@ -174,3 +176,45 @@ def test_freeze_command_invalid_repo(mock_load, mock_config):
     assert "Repository 'test-rep' not found" in result.stdout
     assert "Did you mean" in result.stdout
     assert "test-repo" in result.stdout
+
+
+@pytest.mark.asyncio
+@patch("prime_directive.bin.pd.get_status", new_callable=AsyncMock)
+@patch("prime_directive.bin.pd.get_active_task")
+@patch("prime_directive.bin.pd.generate_sitrep", new_callable=AsyncMock)
+async def test_freeze_logic_settles_db_init_when_sitrep_fails(
+    mock_generate_sitrep, mock_get_active_task, mock_get_status, mock_config
+):
+    from prime_directive.bin.pd import freeze_logic
+
+    mock_get_status.return_value = {
+        "branch": "main",
+        "is_dirty": False,
+        "uncommitted_files": [],
+        "diff_stat": "",
+    }
+    mock_get_active_task.return_value = None
+    init_outcome = []
+
+    async def failing_sitrep(**_kwargs):
+        # Let the init task start before the failure cancels it
+        await asyncio.sleep(0)
+        raise RuntimeError("AI down")
+
+    mock_generate_sitrep.side_effect = failing_sitrep
+
+    async def slow_init_db(_db_path):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            init_outcome.append("cancelled")
+            raise
+
+    with patch("prime_directive.bin.pd.init_db", side_effect=slow_init_db):
+        with pytest.raises(RuntimeError, match="AI down"):
+            await freeze_logic(
+                "test-repo", mock_config, skip_terminal_capture=True
+            )
+
+    # The init task was cancelled and awaited before the error propagated
+    assert init_outcome == ["cancelled"]
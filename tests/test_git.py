@@ -1,5 +1,6 @@
 import pytest
 import shutil
+import signal
 import subprocess
 import time
 import os
@@ -116,3 +117,104 @@ async def test_get_last_touched(temp_git_repo):
 async def test_get_last_touched_no_git(tmp_path):
     ts = await get_last_touched(str(tmp_path))
     assert ts is None
+
+
+async def test_get_status_runs_git_commands_concurrently(temp_git_repo):
+    import asyncio
+    from unittest.mock import patch
+
+    running = 0
+    peak = 0
+
+    async def fake_git(repo_path, args, *, timeout_seconds):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if args[1] == "rev-parse":
+            return 0, "main\n", ""
+        if args[1] == "status":
+            return 0, " M README.md\n", ""
+        return 0, " README.md | 2 +-\n", ""
+
+    with patch("prime_directive.core.git_utils._run_git_command", fake_git):
+        status = await get_status(str(temp_git_repo))
+
+    assert peak == 3
+    assert status["branch"] == "main"
+    assert status["uncommitted_files"] == ["README.md"]
+    assert status["diff_stat"] == "README.md | 2 +-"
+
+
+async def test_get_status_reports_timeout_from_any_command(temp_git_repo):
+    import asyncio
+    from unittest.mock import patch
+
+    finished = []
+
+    async def fake_git(repo_path, args, *, timeout_seconds):
+        if args[1] == "status":
+            raise asyncio.TimeoutError
+        await asyncio.sleep(0.01)
+        finished.append(args[1])
+        return 0, "main\n", ""
+
+    with patch("prime_directive.core.git_utils._run_git_command", fake_git):
+        status = await get_status(str(temp_git_repo))
+
+    assert status["branch"] == "timeout"
+    # The other commands were awaited rather than left running
+    assert sorted(finished) == ["diff", "rev-parse"]
+
+
+async def test_get_status_parses_porcelain_paths(temp_git_repo):
+    from unittest.mock import patch
+
+    porcelain = (
+        " M README.md\n"
+        "?? dir with space/new.txt\n"
+        "R  old.txt -> new.txt\n"
+        "MM both.py\n"
+    )
+
+    async def fake_git(repo_path, args, *, timeout_seconds):
+        if args[1] == "status":
+            return 0, porcelain, ""
+        return 0, "main\n", ""
+
+    with patch("prime_directive.core.git_utils._run_git_command", fake_git):
+        status = await get_status(str(temp_git_repo))
+
+    assert status["uncommitted_files"] == [
+        "README.md",
+        "dir with space/new.txt",
+        "old.txt -> new.txt",
+        "both.py",
+    ]
+
+
+async def test_run_git_command_timeout_does_not_wait_for_grandchildren(
+    tmp_path,
+):
+    import asyncio
+
+    from prime_directive.core.git_utils import _run_git_command
+
+    # The background sleep inherits stdout/stderr and keeps them open after
+    # the command itself is killed; it records its pid for cleanup.
+    pid_file = tmp_path / "grandchild.pid"
+    start = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        await _run_git_command(
+            str(tmp_path),
+            ["sh", "-c", f"sleep 30 & echo $! > '{pid_file}'; exec sleep 30"],
+            timeout_seconds=0.1,
+        )
+
+    assert time.monotonic() - start < 5
+    # Kill the orphaned sleep so the loop sees the pipes close before the
+    # test's event loop is torn down.
+    if pid_file.exists():
+        os.kill(int(pid_file.read_text()), signal.SIGKILL)
+    await asyncio.sleep(0.1)
@@ -0,0 +1,22 @@
+import json
+
+import pytest
+
+from prime_directive.core import json_utils
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_round_trip_with_and_without_orjson(
+    monkeypatch, use_orjson
+):
+    if not use_orjson:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    payload = {"prompt": "café ✓", "stream": False, "n": [1, 2]}
+
+    body = json_utils.json_dumps(payload)
+
+    assert isinstance(body, bytes)
+    assert b" " not in body.replace("café ✓".encode(), b"")
+    assert json.loads(body) == payload
+    assert json_utils.json_loads(body) == payload
+    assert json_utils.json_loads(body.decode()) == payload
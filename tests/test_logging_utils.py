@@ -0,0 +1,76 @@
+import logging
+import logging.handlers
+
+from prime_directive.core.logging_utils import setup_logging, stop_logging
+
+
+def test_setup_logging_writes_through_queue(tmp_path):
+    log_file = tmp_path / "logs" / "pd.log"
+    try:
+        setup_logging(str(log_file))
+        root_handlers = logging.getLogger().handlers
+        assert len(root_handlers) == 1
+        assert isinstance(root_handlers[0], logging.handlers.QueueHandler)
+
+        logging.getLogger("pd.test").info("queued %s", "message")
+        logging.getLogger("pd.test").debug("below threshold")
+    finally:
+        stop_logging()
+
+    lines = log_file.read_text(encoding="utf8").splitlines()
+    assert len(lines) == 1
+    assert lines[0].endswith(" - pd.test - INFO - queued message")
+
+
+def test_setup_logging_again_flushes_previous_file(tmp_path):
+    first = tmp_path / "first.log"
+    second = tmp_path / "second.log"
+    try:
+        setup_logging(str(first))
+        logging.getLogger("pd.test").info("to first")
+        setup_logging(str(second))
+        logging.getLogger("pd.test").info("to second")
+    finally:
+        stop_logging()
+
+    assert "to first" in first.read_text(encoding="utf8")
+    assert "to first" not in second.read_text(encoding="utf8")
+    assert "to second" in second.read_text(encoding="utf8")
+
+
+def test_setup_logging_rotates_large_files(tmp_path, monkeypatch):
+    from prime_directive.core import logging_utils
+
+    monkeypatch.setattr(logging_utils, "_LOG_MAX_BYTES", 200)
+    monkeypatch.setattr(logging_utils, "_LOG_BACKUP_COUNT", 2)
+    log_file = tmp_path / "pd.log"
+    try:
+        setup_logging(str(log_file), rotate=True)
+        for i in range(20):
+            logging.getLogger("pd.test").info("line %d %s", i, "x" * 40)
+    finally:
+        stop_logging()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "pd.log",
+        "pd.log.1",
+        "pd.log.2",
+    ]
+    assert log_file.stat().st_size <= 200
+
+
+def test_setup_logging_is_append_only_by_default(tmp_path, monkeypatch):
+    from prime_directive.core import logging_utils
+
+    monkeypatch.setattr(logging_utils, "_LOG_MAX_BYTES", 200)
+    log_file = tmp_path / "pd.log"
+    try:
+        setup_logging(str(log_file))
+        for i in range(20):
+            logging.getLogger("pd.test").info("line %d %s", i, "x" * 40)
+    finally:
+        stop_logging()
+
+    # Other processes may share the file, so it is never renamed
+    assert [p.name for p in tmp_path.iterdir()] == ["pd.log"]
+    assert len(log_file.read_text(encoding="utf8").splitlines()) == 20
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch, Mock, AsyncMock
 
 import httpx
@@ -7,9 +8,9 @@ from prime_directive.core.scribe import generate_sitrep
 
 async def test_generate_sitrep_success():
     mock_response = Mock()
-    mock_response.json.return_value = {
-        "response": "SITREP: All systems go. Next: Deploy."
-    }
+    mock_response.content = json.dumps(
+        {"response": "SITREP: All systems go. Next: Deploy."}
+    ).encode()
     mock_response.raise_for_status.return_value = None
 
     with patch(
@@ -31,9 +32,10 @@ async def test_generate_sitrep_success():
         assert result == "SITREP: All systems go. Next: Deploy."
         mock_post.assert_called_once()
         _, kwargs = mock_post.call_args
-        assert kwargs["json"]["model"] == "qwen2.5-coder"
-        assert "Test Task" in kwargs["json"]["prompt"]
-        assert "Chief of Staff" in kwargs["json"]["system"]
+        payload = json.loads(kwargs["content"])
+        assert payload["model"] == "qwen2.5-coder"
+        assert "Test Task" in payload["prompt"]
+        assert "Chief of Staff" in payload["system"]
 
 
 async def test_generate_sitrep_timeout():
@@ -66,9 +68,9 @@ async def test_generate_sitrep_connection_error():
 
 async def test_generate_sitrep_retries_then_success():
     mock_response = Mock()
-    mock_response.json.return_value = {
-        "response": "SITREP: Recovered. Next: Continue."
-    }
+    mock_response.content = json.dumps(
+        {"response": "SITREP: Recovered. Next: Continue."}
+    ).encode()
     mock_response.raise_for_status.return_value = None
 
     req = httpx.Request("POST", "http://localhost:11434/api/generate")
@@ -504,3 +504,40 @@ dependencies = ["httpx>=0.27.0"]
     assert "Deep Analysis (LLM)" in result.stdout
     assert "gradient-debugging" in result.stdout
     assert loaded.capabilities.domain_expertise
+
+
+async def test_load_recent_snapshot_texts_reads_human_fields(tmp_path):
+    from datetime import datetime, timezone
+
+    from prime_directive.bin.pd import _load_recent_snapshot_texts
+    from prime_directive.core.db import (
+        ContextSnapshot,
+        Repository,
+        get_session,
+        init_db,
+    )
+
+    db_path = str(tmp_path / "snapshots.db")
+    await init_db(db_path)
+    async for session in get_session(db_path):
+        session.add(Repository(id="repo1", path="/tmp/repo1", priority=1))
+        await session.flush()
+        session.add(
+            ContextSnapshot(
+                repo_id="repo1",
+                timestamp=datetime.now(timezone.utc),
+                git_status_summary="clean",
+                terminal_last_command="ls",
+                terminal_output_summary="x" * 4096,
+                ai_sitrep="long sitrep",
+                human_objective="Ship the parser",
+                human_blocker="  ",
+                human_note="Flaky CI",
+            )
+        )
+        await session.commit()
+
+    texts, count, repos = await _load_recent_snapshot_texts(db_path)
+
+    assert texts == ["Ship the parser", "Flaky CI"]
+    assert (count, repos) == (1, 1)
@@ -101,6 +101,35 @@ def test_detect_current_repo_id_prefers_longest_prefix():
     assert detect_current_repo_id(cwd, repos) == "inner"
 
 
+def test_detect_current_repo_id_respects_directory_boundaries():
+    repos = {
+        "foo": {"path": "/tmp/work/foo"},
+        "foobar": {"path": "/tmp/work/foobar/"},
+    }
+    assert detect_current_repo_id("/tmp/work/foobar", repos) == "foobar"
+    assert detect_current_repo_id("/tmp/work/foo/src", repos) == "foo"
+    assert detect_current_repo_id("/tmp/work/fo", repos) is None
+
+
+def test_detect_current_repo_id_walks_up_to_nearest_repo():
+    repos = {f"repo{i}": {"path": f"/tmp/work/repo{i}"} for i in range(50)}
+    repos["first"] = {"path": "/tmp/work/shared"}
+    repos["second"] = {"path": "/tmp/work/shared/"}
+
+    assert detect_current_repo_id("/tmp/work/repo42/a/b/c", repos) == "repo42"
+    # Several repos on one path: the first configured one wins
+    assert detect_current_repo_id("/tmp/work/shared/x", repos) == "first"
+    assert detect_current_repo_id("/tmp/elsewhere", repos) is None
+
+
+def test_detect_current_repo_id_root_repo_matches_every_directory():
+    repos = {"root": {"path": "/"}, "work": {"path": "/tmp/work"}}
+
+    assert detect_current_repo_id("/", repos) == "root"
+    assert detect_current_repo_id("/usr/lib", repos) == "root"
+    assert detect_current_repo_id("/tmp/work/src", repos) == "work"
+
+
 @pytest.mark.asyncio
 async def test_switch_logic_logs_switch_in_event(tmp_path):
     cfg = OmegaConf.create(
@@ -136,6 +165,10 @@ async def test_switch_logic_logs_switch_in_event(tmp_path):
     mock_result = MagicMock()
     mock_result.scalars.return_value.first.return_value = None
     session.execute = AsyncMock(return_value=mock_result)
+    calls = MagicMock()
+    calls.attach_mock(session.execute, "execute")
+    calls.attach_mock(session.add, "add")
+    calls.attach_mock(session.commit, "commit")
 
     async def get_session_fn(_db_path: str):
         """
@@ -164,8 +197,14 @@ async def test_switch_logic_logs_switch_in_event(tmp_path):
     )
 
     init_db_fn.assert_awaited_once()
-    session.commit.assert_awaited()
+    session.commit.assert_awaited_once()
     assert session.add.called
+    # Snapshot read and event write share one transaction and one commit
+    assert [name for name, *_ in calls.mock_calls] == [
+        "execute",
+        "add",
+        "commit",
+    ]
 
     added_obj = session.add.call_args[0][0]
     assert isinstance(added_obj, EventLog)